@@ -0,0 +1,124 @@
+from contextlib import contextmanager
+
+import pygame
+
+
+class AssetCache:
+    """Registro compartido de imágenes y máscaras.
+
+    Cada superficie se decodifica del disco una sola vez y se comparte entre
+    todas las naves que la usan. Las entradas se indexan por
+    (ruta, tamaño destino, alpha).
+    """
+    def __init__(self):
+        # Deshabilitado (ver `disabled`): no se decodifica nada y se devuelve None
+        self.enabled = True
+        self._surfaces = {}
+        self._masks = {}
+        # Variantes derivadas de una superficie: (superficie, tamaño, tinte) -> superficie
+        self._variants = {}
+        # Contadores: hits/misses por consulta y lecturas reales a disco
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+
+    def _key(self, path, size, alpha):
+        # sin ventana (headless) las superficies quedan sin convertir: se cachean aparte
+        converted = pygame.display.get_surface() is not None
+        return (path, (int(size[0]), int(size[1])) if size else None, bool(alpha), converted)
+
+    def _decode(self, path, alpha):
+        # Imagen original (sin escalar) compartida por todos los tamaños
+        key = self._key(path, None, alpha)
+        surf = self._surfaces.get(key)
+        if surf is None:
+            surf = pygame.image.load(path)
+            # convert necesita un modo de video; las máscaras salen iguales sin él
+            if key[3]:
+                surf = surf.convert_alpha() if alpha else surf.convert()
+            self.disk_loads += 1
+            self._surfaces[key] = surf
+        return surf
+
+    def load_image(self, path, size=None, alpha=True):
+        """Devolver la superficie de `path`, escalada a `size` si se indica.
+
+        Propaga `pygame.error` / `FileNotFoundError` igual que `pygame.image.load`.
+        """
+        if not self.enabled:
+            return None
+        key = self._key(path, size, alpha)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = self._decode(path, alpha)
+        if size:
+            surf = pygame.transform.scale(surf, key[1])
+            self._surfaces[key] = surf
+        return surf
+
+    def load_mask(self, path, size=None, alpha=True):
+        """Máscara de colisión asociada a `load_image(path, size, alpha)`."""
+        if not self.enabled:
+            return None
+        key = self._key(path, size, alpha)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = pygame.mask.from_surface(self.load_image(path, size, alpha))
+            self._masks[key] = mask
+        return mask
+
+    def variant(self, surface, size=None, tint=None):
+        """Versión escalada y/o teñida de `surface`, calculada una sola vez.
+
+        `tint` es un RGBA que se multiplica (BLEND_RGBA_MULT) sobre la imagen.
+        """
+        key = (surface, (int(size[0]), int(size[1])) if size else None, tuple(tint) if tint else None)
+        surf = self._variants.get(key)
+        if surf is not None:
+            return surf
+        surf = surface
+        if key[1] and key[1] != surface.get_size():
+            surf = pygame.transform.scale(surface, key[1])
+        if key[2]:
+            surf = surf.copy()
+            surf.fill(key[2], special_flags=pygame.BLEND_RGBA_MULT)
+        self._variants[key] = surf
+        return surf
+
+    @contextmanager
+    def disabled(self):
+        """Deshabilitar la carga solo dentro del bloque (p.ej. un `Game` headless)"""
+        previous = self.enabled
+        self.enabled = False
+        try:
+            yield self
+        finally:
+            self.enabled = previous
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_loads': self.disk_loads,
+            'surfaces': len(self._surfaces),
+            'masks': len(self._masks),
+            'variants': len(self._variants),
+        }
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+
+    def clear(self):
+        self._surfaces.clear()
+        self._masks.clear()
+        self._variants.clear()
+        self.reset_stats()
+
+
+# Instancia global usada por Player, Enemy, SpaceShip y Game
+assets = AssetCache()
@@ -0,0 +1,62 @@
+import random
+import pygame
+
+
+class Starfield:
+    """Fondo de estrellas pre-renderizado.
+
+    Las capas estáticas se componen una sola vez sobre el color de fondo; las
+    capas con velocidad > 0 se guardan aparte y se desplazan verticalmente
+    (parallax). Usa su propio RNG para no alterar el `random` global.
+
+    Args:
+        width (int): Ancho del área.
+        height (int): Alto del área.
+        layers (list): Tuplas (cantidad, radio, color, velocidad px/frame).
+        background (tuple): Color de fondo.
+        seed (int): Semilla del RNG privado.
+    """
+    def __init__(self, width, height, layers, background, seed=42):
+        self.width = width
+        self.height = height
+        self.rng = random.Random(seed)
+        self.base = pygame.Surface((width, height))
+        self.base.fill(background)
+        # capas desplazables: [superficie, velocidad, offset]
+        self.scrolling = []
+        for count, radius, color, speed in layers:
+            if speed:
+                layer = pygame.Surface((width, height), pygame.SRCALPHA)
+                self._draw_stars(layer, count, radius, color)
+                self.scrolling.append([layer, speed, 0.0])
+            else:
+                self._draw_stars(self.base, count, radius, color)
+        if pygame.display.get_surface() is not None:
+            self.base = self.base.convert()
+            for entry in self.scrolling:
+                entry[0] = entry[0].convert_alpha()
+
+    def _draw_stars(self, surface, count, radius, color):
+        for i in range(count):
+            x = self.rng.randint(0, self.width)
+            y = self.rng.randint(0, self.height)
+            pygame.draw.circle(surface, color, (x, y), radius)
+
+    @property
+    def is_static(self):
+        return not self.scrolling
+
+    def update(self, frames=1):
+        for entry in self.scrolling:
+            entry[2] = (entry[2] + entry[1] * frames) % self.height
+
+    def draw_area(self, window, rect):
+        """Restaurar solo `rect` desde la capa base (renderizado por rects sucios)"""
+        window.blit(self.base, rect, rect)
+
+    def draw(self, window):
+        window.blit(self.base, (0, 0))
+        for layer, speed, offset in self.scrolling:
+            oy = int(offset)
+            window.blit(layer, (0, oy))
+            window.blit(layer, (0, oy - self.height))
@@ -0,0 +1,276 @@
+"""Simulador de balance: muchas partidas headless en paralelo con un bot.
+
+Cada partida usa su propia semilla y un jugador scripteado; los procesos del
+pool reportan nivel alcanzado, bajas, tiempo de supervivencia y vidas
+perdidas por origen (balas / choques), además de un desglose por nivel.
+El resumen agrega percentiles por sesión y por nivel:
+
+    python balance.py --sessions 2000 --out balance.json --csv niveles.csv
+    python balance.py --set PLAYER_SHOOT_COOLDOWN=8 --set purple.shot_rate=0.05
+"""
+import argparse
+import ast
+import contextlib
+import csv
+import functools
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import constants
+from bench import percentile
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, ENEMY_TYPES, ENEMY_WIDTH, ENEMY_HEIGHT, PLAYER_WIDTH
+from game import Game
+from inputs import ScriptedInput, INPUT_LEFT, INPUT_RIGHT, INPUT_SHOOT
+
+
+def bot_sweep(game):
+    """Barre la pantalla de lado a lado disparando siempre"""
+    phase = (game.game_time * FPS) // 90 % 2
+    return INPUT_SHOOT | (INPUT_LEFT if phase else INPUT_RIGHT)
+
+
+def bot_track(game):
+    """Se alinea con el enemigo más bajo y dispara"""
+    target = None
+    for e in game.enemy_wave.get_alive_enemies():
+        if e.y > -ENEMY_HEIGHT and (target is None or e.y > target.y):
+            target = e
+    if target is None:
+        return INPUT_SHOOT
+    dx = (target.x + ENEMY_WIDTH / 2) - (game.player.x + PLAYER_WIDTH / 2)
+    if dx < -4:
+        return INPUT_SHOOT | INPUT_LEFT
+    if dx > 4:
+        return INPUT_SHOOT | INPUT_RIGHT
+    return INPUT_SHOOT
+
+
+BOTS = {'sweep': bot_sweep, 'track': bot_track}
+
+
+def parse_override(text):
+    """'NOMBRE=valor' o 'color.campo=valor' -> (nombre, valor)"""
+    name, _, value = text.partition('=')
+    if not value:
+        raise argparse.ArgumentTypeError(f"override inválido: {text!r} (se espera NOMBRE=valor)")
+    try:
+        value = json.loads(value)
+    except ValueError:
+        pass
+    return name.strip(), value
+
+
+_PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@functools.lru_cache(maxsize=None)
+def names_read():
+    """Nombres que lee algún módulo del proyecto (fuera de constants.py)"""
+    names = set()
+    for entry in os.scandir(_PROJECT_DIR):
+        if not entry.name.endswith('.py') or entry.name == 'constants.py':
+            continue
+        with open(entry.path, encoding='utf-8') as f:
+            tree = ast.parse(f.read(), entry.path)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+                names.add(node.id)
+            elif isinstance(node, ast.Attribute) and isinstance(node.ctx, ast.Load):
+                names.add(node.attr)
+    return frozenset(names)
+
+
+def project_modules():
+    """Módulos del proyecto ya cargados (incluido el script principal)"""
+    for module in list(sys.modules.values()):
+        path = getattr(module, '__file__', None)
+        if path and os.path.dirname(os.path.abspath(path)) == _PROJECT_DIR:
+            yield module
+
+
+def check_override(name):
+    """Lanza ValueError si el override no existe o no tendría efecto"""
+    if '.' in name:
+        color, field = name.split('.', 1)
+        if color not in ENEMY_TYPES:
+            raise ValueError(f"tipo de enemigo desconocido: {color}")
+        # enemy.py y swarm.py solo leen los campos que ya trae ENEMY_TYPES
+        if not any(field in props for props in ENEMY_TYPES.values()):
+            raise ValueError(f"campo de enemigo desconocido: {field}")
+        return
+    if not hasattr(constants, name):
+        raise ValueError(f"constante desconocida: {name}")
+    if name not in names_read():
+        raise ValueError(f"ningún módulo lee {name}: el override no tendría efecto")
+
+
+def apply_overrides(overrides):
+    """Aplicar los overrides en el proceso actual (también en cada worker)"""
+    for name, value in overrides:
+        check_override(name)
+        if '.' in name:
+            color, field = name.split('.', 1)
+            # el dict se comparte con enemy.py y swarm.py
+            ENEMY_TYPES[color][field] = value
+            continue
+        # los módulos que hicieron `from constants import ...` tienen su propia copia
+        original = getattr(constants, name)
+        for module in project_modules():
+            if getattr(module, name, None) is original:
+                setattr(module, name, value)
+
+
+def run_session(job):
+    """Jugar una partida; devuelve el resumen y el desglose por nivel"""
+    seed, bot, max_ticks = job
+    game = Game(font=None, FPS=FPS, lives=constants.INITIAL_LIVES, window=None,
+                screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT,
+                headless=True, input_source=ScriptedInput(BOTS[bot]), seed=seed)
+    damage = game.damage_sources
+    levels = {}
+    ticks = 0
+    while not game.game_over and not game.victory and ticks < max_ticks:
+        level = game.level
+        kills = game.kills
+        bullet, collision = damage['bullet'], damage['collision']
+        game.update()
+        ticks += 1
+        # [ticks, bajas, vidas por balas, vidas por choques, superado]
+        row = levels.setdefault(level, [0, 0, 0, 0, False])
+        row[0] += 1
+        row[1] += game.kills - kills
+        row[2] += damage['bullet'] - bullet
+        row[3] += damage['collision'] - collision
+        if game.level != level:
+            row[4] = True
+    return {
+        'seed': seed,
+        'level': game.level,
+        'kills': game.kills,
+        'score': game.score,
+        'survival_s': ticks / FPS,
+        'game_over': game.game_over,
+        'damage_bullet': damage['bullet'],
+        'damage_collision': damage['collision'],
+        'levels': levels,
+    }
+
+
+def _quiet_worker(overrides):
+    # los avisos de assets/sonido de cada worker no deben mezclarse con el reporte
+    sys.stdout = open(os.devnull, 'w')
+    apply_overrides(overrides)
+
+
+def run_sessions(seeds, bot, max_ticks, workers, overrides):
+    jobs = [(seed, bot, max_ticks) for seed in seeds]
+    if workers <= 1:
+        with contextlib.redirect_stdout(sys.stderr):
+            apply_overrides(overrides)
+            return [run_session(job) for job in jobs]
+    chunk = max(1, len(jobs) // (workers * 8))
+    with multiprocessing.Pool(workers, initializer=_quiet_worker, initargs=(overrides,)) as pool:
+        return list(pool.imap_unordered(run_session, jobs, chunksize=chunk))
+
+
+def stats(values):
+    return {
+        'p10': round(percentile(values, 10), 3),
+        'p50': round(percentile(values, 50), 3),
+        'p90': round(percentile(values, 90), 3),
+        'mean': round(sum(values) / len(values), 3) if values else 0.0,
+    }
+
+
+def aggregate(results):
+    """Percentiles por sesión y por nivel"""
+    sessions = {key: stats([r[key] for r in results])
+                for key in ('level', 'kills', 'score', 'survival_s', 'damage_bullet', 'damage_collision')}
+    per_level = {}
+    top = max((max(r['levels']) for r in results if r['levels']), default=0)
+    for level in range(1, top + 1):
+        rows = [r['levels'][level] for r in results if level in r['levels']]
+        if not rows:
+            continue
+        cleared = [row[0] / FPS for row in rows if row[4]]
+        per_level[level] = {
+            'reached': len(rows),
+            'cleared': len(cleared),
+            'died': sum(1 for r in results if r['game_over'] and r['level'] == level),
+            'clear_time_s': stats(cleared),
+            'kills': stats([row[1] for row in rows]),
+            'damage_bullet': sum(row[2] for row in rows),
+            'damage_collision': sum(row[3] for row in rows),
+        }
+    return sessions, per_level
+
+
+def write_csv(path, per_level):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['level', 'reached', 'cleared', 'died', 'clear_p10_s', 'clear_p50_s', 'clear_p90_s',
+                         'kills_p50', 'damage_bullet', 'damage_collision'])
+        for level, row in per_level.items():
+            t = row['clear_time_s']
+            writer.writerow([level, row['reached'], row['cleared'], row['died'], t['p10'], t['p50'], t['p90'],
+                             row['kills']['p50'], row['damage_bullet'], row['damage_collision']])
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulaciones de balance en paralelo (sin ventana)")
+    parser.add_argument('--sessions', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=0, help="semilla de la primera partida")
+    parser.add_argument('--max-ticks', type=int, default=FPS * 600, help="tope por partida (por defecto 10 min)")
+    parser.add_argument('--bot', choices=sorted(BOTS), default='track')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--set', dest='overrides', type=parse_override, action='append', default=[],
+                        metavar='NOMBRE=valor', help="constante o campo de ENEMY_TYPES (p.ej. blue.speed=1.2)")
+    parser.add_argument('--out', help="archivo JSON de salida (por defecto stdout)")
+    parser.add_argument('--csv', help="tabla por nivel en CSV")
+    args = parser.parse_args(argv)
+    # validar antes de lanzar el pool: un error en el inicializador de un worker lo colgaría
+    for name, _ in args.overrides:
+        try:
+            check_override(name)
+        except ValueError as e:
+            parser.error(str(e))
+
+    t0 = time.perf_counter()
+    seeds = range(args.seed, args.seed + args.sessions)
+    results = run_sessions(seeds, args.bot, args.max_ticks, args.workers, args.overrides)
+    results.sort(key=lambda r: r['seed'])
+    sessions, per_level = aggregate(results)
+    report = {
+        'meta': {
+            'sessions': args.sessions,
+            'seed': args.seed,
+            'bot': args.bot,
+            'max_ticks': args.max_ticks,
+            'workers': args.workers,
+            'overrides': dict(args.overrides),
+            'elapsed_s': round(time.perf_counter() - t0, 2),
+        },
+        'sessions': sessions,
+        'levels': per_level,
+    }
+    if args.csv:
+        write_csv(args.csv, per_level)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,236 @@
+"""Benchmarks de los caminos críticos de simulación y dibujo.
+
+Construye estados de `Game` en los niveles pedidos (generando las oleadas
+sucesivas con `EnemyWave.create_wave`), agrega una carga sintética de balas y
+mide `update()` y `draw()` por separado con el driver de video `dummy`. Antes
+de cada frame se regenera la misma oleada, así todos los frames medidos corren
+en el nivel pedido con todos sus enemigos.
+El resultado es JSON para poder comparar dos corridas en CI:
+
+    python bench.py --out actual.json
+    python bench.py --compare base.json --threshold 0.15
+    python bench.py --swarm --levels 100    # oleadas vectorizadas (swarm.py)
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_FONT_SIZE, ENEMY_WIDTH, ENEMY_HEIGHT
+from game import Game
+from inputs import ScriptedInput, INPUT_LEFT, INPUT_RIGHT, INPUT_SHOOT
+
+
+PHASES = ('update', 'draw')
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(samples_ms):
+    return {
+        'p50_ms': round(percentile(samples_ms, 50), 4),
+        'p95_ms': round(percentile(samples_ms, 95), 4),
+        'p99_ms': round(percentile(samples_ms, 99), 4),
+        'mean_ms': round(sum(samples_ms) / len(samples_ms), 4) if samples_ms else 0.0,
+    }
+
+
+def build_game(window, font, level, seed, swarm=False):
+    """Partida fija en `level`; devuelve (game, wave) con `wave` para `place_wave`"""
+    # el jugador se mueve de lado a lado y dispara siempre que puede
+    def script(game):
+        phase = (game.game_time * FPS) // 90 % 2
+        return INPUT_SHOOT | (INPUT_LEFT if phase else INPUT_RIGHT)
+
+    # sin base de puntajes (no deja scores.db en el directorio actual)
+    game = Game(font=font, FPS=FPS, lives=3, window=window,
+                screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT,
+                input_source=ScriptedInput(script), seed=seed, swarm=swarm, scores=False)
+    game.in_menu = False
+    # sin sonido: no forma parte de lo que se mide
+    game.sounds.clear()
+    # la oleada medida se regenera en cada frame: nunca se pasa de nivel
+    game.level_up = lambda: None
+    for lvl in range(2, level):
+        game.level = lvl
+        game.create_wave()
+    # estado previo a la oleada de `level` (en el nivel 1, la primera oleada)
+    wave = (level, game.enemy_wave.prev_amount if level > 1 else None, game.rng.getstate())
+    place_wave(game, wave)
+    return game, wave
+
+
+def place_wave(game, wave):
+    """Regenerar siempre la misma oleada de `level` distribuida dentro de la pantalla"""
+    level, prev_amount, rng_state = wave
+    game.level = level
+    game.enemy_wave.prev_amount = prev_amount
+    game.rng.setstate(rng_state)
+    game.create_wave()
+    game.level_start_timer = 0
+    rng = game.rng
+    for e in game.enemy_wave.enemies:
+        e.x = rng.uniform(0, SCREEN_WIDTH - ENEMY_WIDTH)
+        e.y = rng.uniform(0, SCREEN_HEIGHT * 0.6 - ENEMY_HEIGHT)
+        e.save_position()
+
+
+def prepare_frame(game, wave, player_bullets, enemy_bullets):
+    """Mantener constantes la oleada (posiciones y vida), las balas y al jugador con vida"""
+    place_wave(game, wave)
+    game.player.health = game.player.max_health
+    game.game_over = False
+    rng = game.rng
+    while len(game.player.bullets) < player_bullets:
+        game.player.bullets.spawn(rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT),
+                                  6, 20, -game.player.bullet_speed)
+    while len(game.enemy_bullets) < enemy_bullets:
+        game.enemy_bullets.spawn(rng.uniform(0, SCREEN_WIDTH), rng.uniform(-40, SCREEN_HEIGHT),
+                                 6, 16, 6 + game.level * 0.02)
+
+
+def check_load(game, level, enemies):
+    """Cada frame medido debe correr en `level` con la oleada completa"""
+    if game.level != level or game.enemy_wave.alive_count != enemies or game.level_start_timer:
+        raise RuntimeError(f"carga inestable: nivel {game.level} con {game.enemy_wave.alive_count} "
+                           f"enemigos (se esperaba nivel {level} con {enemies})")
+
+
+def bench_level(window, font, level, frames, warmup, player_bullets, enemy_bullets, seed, swarm=False):
+    game, wave = build_game(window, font, level, seed, swarm)
+    enemies = len(game.enemy_wave.enemies)
+    timings = {phase: [] for phase in PHASES}
+    perf = time.perf_counter
+    for i in range(warmup + frames):
+        prepare_frame(game, wave, player_bullets, enemy_bullets)
+        check_load(game, level, enemies)
+        t0 = perf()
+        game.update()
+        t1 = perf()
+        game.draw()
+        t2 = perf()
+        if i >= warmup:
+            timings['update'].append((t1 - t0) * 1000.0)
+            timings['draw'].append((t2 - t1) * 1000.0)
+
+    # pasada aparte (más corta) para asignaciones: tracemalloc distorsiona los tiempos
+    game, wave = build_game(window, font, level, seed, swarm)
+    alloc = {phase: [] for phase in PHASES}
+    tracemalloc.start()
+    try:
+        for i in range(min(frames, 120)):
+            prepare_frame(game, wave, player_bullets, enemy_bullets)
+            check_load(game, level, enemies)
+            for phase, fn in (('update', game.update), ('draw', game.draw)):
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                fn()
+                peak = tracemalloc.get_traced_memory()[1]
+                alloc[phase].append((peak - before) / 1024.0)
+    finally:
+        tracemalloc.stop()
+
+    result = {'level': level, 'enemies': enemies, 'player_bullets': player_bullets, 'enemy_bullets': enemy_bullets}
+    for phase in PHASES:
+        stats = summarize(timings[phase])
+        stats['alloc_kib_p50'] = round(percentile(alloc[phase], 50), 3)
+        stats['alloc_kib_max'] = round(max(alloc[phase]) if alloc[phase] else 0.0, 3)
+        result[phase] = stats
+    return result
+
+
+def run(levels, frames, warmup, player_bullets, enemy_bullets, seed, swarm=False):
+    pygame.init()
+    window = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    font = pygame.font.Font(None, GAME_FONT_SIZE)
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'frames': frames,
+            'warmup': warmup,
+            'seed': seed,
+            'swarm': swarm,
+        },
+        'levels': {},
+    }
+    for level in levels:
+        report['levels'][str(level)] = bench_level(window, font, level, frames, warmup,
+                                                   player_bullets, enemy_bullets, seed, swarm)
+    pygame.quit()
+    return report
+
+
+def compare(base, current, threshold, metric='p95_ms'):
+    """Lista de regresiones (nivel, fase, base, actual, variación) mayores a `threshold`"""
+    regressions = []
+    for level, cur in current['levels'].items():
+        ref = base.get('levels', {}).get(level)
+        if not ref:
+            continue
+        for phase in PHASES:
+            old = ref[phase][metric]
+            new = cur[phase][metric]
+            if old > 0 and (new - old) / old > threshold:
+                regressions.append((level, phase, old, new, (new - old) / old))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de update()/draw() por nivel")
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 25, 50, 100])
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--warmup', type=int, default=30)
+    parser.add_argument('--player-bullets', type=int, default=5)
+    parser.add_argument('--enemy-bullets', type=int, default=60)
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--swarm', action='store_true', help="usar SwarmWave (enemigos en arreglos NumPy)")
+    parser.add_argument('--out', help="archivo JSON de salida (por defecto stdout)")
+    parser.add_argument('--compare', help="JSON base contra el que comparar")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="variación máxima permitida del p95 (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    # los avisos del juego (assets/sonido) no deben mezclarse con el JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run(args.levels, args.frames, args.warmup, args.player_bullets, args.enemy_bullets, args.seed,
+                     args.swarm)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            base = json.load(f)
+        regressions = compare(base, report, args.threshold)
+        for level, phase, old, new, delta in regressions:
+            print(f"REGRESIÓN nivel {level} {phase}: p95 {old:.3f}ms -> {new:.3f}ms (+{delta:.0%})",
+                  file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
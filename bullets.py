@@ -0,0 +1,151 @@
+import numpy as np
+import pygame
+
+from asset_cache import assets
+
+
+# Filas de la matriz de balas (struct-of-arrays en un único bloque)
+X, Y, W, H, DY, SPRITE = range(6)
+NO_SPRITE = -1
+
+
+class BulletPool:
+    """Almacén compacto de balas.
+
+    Cada bala ocupa una columna de una matriz NumPy de 6 filas
+    (x, y, ancho, alto, dy, id de sprite). El movimiento se aplica en un solo
+    paso vectorizado y las balas descartadas se compactan en el lugar,
+    conservando el orden de disparo.
+    """
+    def __init__(self, capacity=16):
+        self._data = np.zeros((6, max(1, capacity)), dtype=np.float64)
+        self.count = 0
+        # id de sprite -> superficie (None = dibujar rectángulo)
+        self.sprites = []
+        self._sprite_ids = {}
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self, needed=0):
+        data = np.zeros((6, max(needed, self._data.shape[1] * 2)), dtype=np.float64)
+        data[:, :self.count] = self._data[:, :self.count]
+        self._data = data
+
+    def sprite_id(self, surface):
+        if surface is None:
+            return NO_SPRITE
+        sid = self._sprite_ids.get(surface)
+        if sid is None:
+            sid = len(self.sprites)
+            self.sprites.append(surface)
+            self._sprite_ids[surface] = sid
+        return sid
+
+    def spawn(self, x, y, width, height, dy, sprite=None):
+        """Agregar una bala; devuelve su índice"""
+        if self.count >= self._data.shape[1]:
+            self._grow()
+        i = self.count
+        col = self._data[:, i]
+        col[X] = x
+        col[Y] = y
+        col[W] = width
+        col[H] = height
+        col[DY] = dy
+        col[SPRITE] = self.sprite_id(sprite)
+        self.count += 1
+        return i
+
+    def spawn_many(self, xs, ys, width, height, dy, sprites):
+        """Agregar un bloque de balas (xs/ys arreglos, una superficie por bala)"""
+        k = len(xs)
+        if not k:
+            return
+        i = self.count
+        if i + k > self._data.shape[1]:
+            self._grow(i + k)
+        cols = self._data[:, i:i + k]
+        cols[X] = xs
+        cols[Y] = ys
+        cols[W] = width
+        cols[H] = height
+        cols[DY] = dy
+        cols[SPRITE] = [self.sprite_id(s) for s in sprites]
+        self.count += k
+
+    def update(self, min_y=None, max_y=None):
+        """Mover todas las balas y eliminar las que salen de [min_y, max_y]"""
+        n = self.count
+        if not n:
+            return
+        d = self._data
+        ys = d[Y, :n]
+        ys += d[DY, :n]
+        if min_y is None and max_y is None:
+            return
+        out = np.zeros(n, dtype=bool)
+        if min_y is not None:
+            out |= ys < min_y
+        if max_y is not None:
+            out |= ys > max_y
+        if out.any():
+            keep = ~out
+            k = int(np.count_nonzero(keep))
+            d[:, :k] = d[:, :n][:, keep]
+            self.count = k
+
+    def remove(self, i):
+        """Eliminar la bala `i` manteniendo el orden del resto"""
+        n = self.count
+        if i < 0 or i >= n:
+            return
+        self._data[:, i:n - 1] = self._data[:, i + 1:n]
+        self.count = n - 1
+
+    def clear(self):
+        self.count = 0
+
+    def sprite(self, i):
+        """Superficie de la bala `i` (None si se dibuja como rectángulo)"""
+        sid = int(self._data[SPRITE, i])
+        return self.sprites[sid] if sid >= 0 else None
+
+    def rect(self, i):
+        d = self._data
+        return pygame.Rect(float(d[X, i]), float(d[Y, i]), float(d[W, i]), float(d[H, i]))
+
+    def rects(self):
+        n = self.count
+        d = self._data[:4, :n].tolist()
+        return [pygame.Rect(x, y, w, h) for x, y, w, h in zip(*d)]
+
+    def rows(self, alpha=1.0):
+        """Lista de (x, y, ancho, alto, sprite) para dibujar.
+
+        Con `alpha` < 1 la posición se interpola hacia el tick anterior.
+        """
+        n = self.count
+        d = self._data[:, :n]
+        if alpha < 1.0:
+            ys = (d[Y] - d[DY] * (1.0 - alpha)).tolist()
+        else:
+            ys = d[Y].tolist()
+        d = d.tolist()
+        sprites = self.sprites
+        return [(x, y, w, h, sprites[int(s)] if s >= 0 else None)
+                for x, y, w, h, s in zip(d[X], ys, d[W], d[H], d[SPRITE])]
+
+    def draw(self, window, color, alpha=1.0):
+        """Dibujar todas las balas; devuelve los rects afectados.
+
+        Los sprites se dibujan al tamaño de la bala (variante cacheada), el
+        mismo que usan las colisiones por máscara.
+        """
+        drawn = []
+        for x, y, w, h, img in self.rows(alpha):
+            if img:
+                drawn.append(window.blit(assets.variant(img, (int(w), int(h))), (x, y)))
+            else:
+                drawn.append(pygame.draw.rect(window, color, (x, y, w, h)))
+        return drawn
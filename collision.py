@@ -0,0 +1,79 @@
+import pygame
+
+
+class MaskNarrowphase:
+    """Segunda etapa de colisiones: `Mask.overlap` sobre los pares cuyo rect
+    ya chocó en la broadphase.
+
+    Las máscaras de las naves son las compartidas de `asset_cache`; las de
+    las balas se calculan una vez por (superficie, tamaño) y las balas sin
+    imagen usan una máscara llena del tamaño del rect. Deshabilitada, todo
+    choque de rects cuenta como impacto (comportamiento original).
+    """
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._masks = {}
+        # Contadores acumulados y del último tick
+        self.pairs = 0
+        self.tests = 0
+        self.rejected = 0
+        self.tick_pairs = 0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+
+    def begin_tick(self):
+        self.tick_pairs = 0
+
+    def mask_for(self, surface, size):
+        """Máscara de `surface` escalada a `size` (llena si no hay superficie)"""
+        size = (int(size[0]), int(size[1]))
+        key = (surface, size)
+        mask = self._masks.get(key)
+        if mask is None:
+            if surface is None:
+                mask = pygame.Mask(size, fill=True)
+            else:
+                if surface.get_size() != size:
+                    surface = pygame.transform.scale(surface, size)
+                mask = pygame.mask.from_surface(surface)
+            self._masks[key] = mask
+        return mask
+
+    def overlap(self, rect_a, mask_a, rect_b, mask_b):
+        """¿Se tocan los píxeles opacos? Sin máscaras alcanza con el rect"""
+        if not self.enabled:
+            return True
+        self.pairs += 1
+        self.tick_pairs += 1
+        if mask_a is None and mask_b is None:
+            return True
+        if mask_a is None:
+            mask_a = self.mask_for(None, rect_a.size)
+        if mask_b is None:
+            mask_b = self.mask_for(None, rect_b.size)
+        self.tests += 1
+        if mask_a.overlap(mask_b, (rect_b.x - rect_a.x, rect_b.y - rect_a.y)) is None:
+            self.rejected += 1
+            return False
+        return True
+
+    def bullet_overlap(self, bullet_rect, bullet_surface, rect, mask):
+        """`overlap` para una bala; su máscara se busca solo si hace falta"""
+        if not self.enabled:
+            return True
+        return self.overlap(bullet_rect, self.mask_for(bullet_surface, bullet_rect.size), rect, mask)
+
+    def stats(self):
+        return {'pairs': self.pairs, 'tests': self.tests, 'rejected': self.rejected,
+                'masks': len(self._masks)}
+
+    def reset_stats(self):
+        self.pairs = 0
+        self.tests = 0
+        self.rejected = 0
+        self.tick_pairs = 0
+
+    def clear(self):
+        self._masks.clear()
+        self.reset_stats()
@@ -3,6 +3,11 @@ SCREEN_WIDTH = 900
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# Bucle de paso fijo: la simulación avanza en ticks de 1 / FPS segundos según
+# el tiempo real transcurrido; el dibujo interpola entre los dos últimos ticks
+MAX_FRAME_TIME = 0.25    # segundos reales considerados por frame como máximo
+MAX_CATCHUP_TICKS = 8    # ticks de simulación por frame como máximo (evita la espiral)
+
 # ============== CONFIGURACIÓN DEL JUGADOR ==============
 PLAYER_WIDTH = 50
 PLAYER_HEIGHT = 40
@@ -50,6 +55,38 @@ INITIAL_LIVES = 3
 MAX_LEVEL = 100
 GAME_FONT_SIZE = 36
 HUD_FONT_SIZE = 24
+# Oleadas en modo enjambre: enemigos en arreglos NumPy (ver swarm.py)
+SWARM_WAVE = False
+# Disparo enemigo: 'sampled' (original: se sortean algunos tiradores por frame;
+# reproduce los replays grabados) o 'batched' (todos los cooldowns de una vez, ver firing.py)
+ENEMY_FIRING_MODE = 'sampled'
+# En modo 'batched': True mantiene la tasa estadística de 'sampled' por shot_rate;
+# False avanza todos los cooldowns cada frame y dispara con shot_rate al llegar a 0
+ENEMY_FIRING_LEGACY_RATE = True
+
+# ============== CONFIGURACIÓN DEL FONDO ==============
+# Capas de estrellas: (cantidad, radio, color, velocidad en px/frame)
+# Velocidad 0 = capa estática (se pre-renderiza junto con el color de fondo)
+STARFIELD_LAYERS = [
+    (80, 1, (200, 200, 200), 0.0),
+]
+STARFIELD_SEED = 42
+
+# ============== CONFIGURACIÓN DE RENDER ==============
+# Renderizado por rectángulos sucios (solo se actualizan las áreas que cambian)
+DIRTY_RECT_RENDERING = False
+# Calidad adaptativa: si el frame se pasa del presupuesto se reducen detalles (ver pacing.py)
+ADAPTIVE_QUALITY = True
+
+# ============== DEPURACIÓN ==============
+# Overlay de tiempos por fase (F3) y exportación a CSV (F4)
+PROFILER_TOGGLE_KEY = 'f3'
+PROFILER_EXPORT_KEY = 'f4'
+# Colisiones pixel-perfect (máscaras) tras la broadphase por rects; F5 alterna
+PIXEL_PERFECT_COLLISIONS = False
+COLLISION_MASK_TOGGLE_KEY = 'f5'
+# Snapshots de tracemalloc en cada cambio de nivel (ver memtrack.py); tiene costo, solo para depurar
+MEMORY_TRACKING = False
 
 # ============== CONFIGURACIÓN DE COLORES ==============
 COLOR_BACKGROUND = (0, 0, 20)      # Azul oscuro
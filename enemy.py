@@ -1,14 +1,33 @@
-import pygame
 import random
 import os
+import numpy as np
 from spaceship import SpaceShip
+from asset_cache import assets
+from firing import fire_batch, emit_shots, shot_size
 from constants import ENEMY_TYPES, ENEMY_IMAGE_PATHS, ENEMY_SHOT_IMAGE_PATHS, ENEMY_WIDTH, ENEMY_HEIGHT
 
 
 class Enemy(SpaceShip):
-    def __init__(self, x, y, color='blue', level=1):
+    __slots__ = ('rng', 'color', 'base_speed', 'speed', 'base_score', 'shot_rate', 'dx', 'wave')
+
+    def __init__(self, x, y, color='blue', level=1, rng=None):
+        super().__init__(x, y, ENEMY_TYPES[color]['health'], ENEMY_WIDTH, ENEMY_HEIGHT)
+        self.reset(x, y, color=color, level=level, rng=rng)
+
+    def reset(self, x, y, color='blue', level=1, rng=None):
+        """(Re)inicializar el enemigo en el lugar; usado también por EnemyPool"""
         props = ENEMY_TYPES[color]
-        super().__init__(x, y, props['health'], ENEMY_WIDTH, ENEMY_HEIGHT)
+        # RNG de la sesión (random.Random); sin él se usa el módulo global
+        self.rng = rng if rng is not None else random
+        # oleada a la que pertenece (None = fuera de oleada o ya eliminado)
+        self.wave = None
+        self.x = x
+        self.y = y
+        self.save_position()
+        self.health = props['health']
+        self.max_health = props['health']
+        if self._bullets is not None:
+            self._bullets.clear()
         self.color = color
         self.base_speed = props['speed']
         # velocidad vertical, se escala con el nivel (pequeño incremento por nivel)
@@ -16,25 +35,27 @@ class Enemy(SpaceShip):
         self.base_score = props.get('score', 10)
         self.shot_rate = props.get('shot_rate', 0.01)
 
-        # Cargar imagenes si existen
+        # Cargar imagenes si existen (compartidas vía asset_cache)
+        self.image = None
+        self.mask = None
+        self.bullet_img = None
         try:
             img_path = ENEMY_IMAGE_PATHS.get(color)
             if img_path and os.path.exists(img_path):
-                self.image = pygame.image.load(img_path).convert_alpha()
-                self.image = pygame.transform.scale(self.image, (self.width, self.height))
-                self.mask = pygame.mask.from_surface(self.image)
+                self.image = assets.load_image(img_path, (self.width, self.height))
+                self.mask = assets.load_mask(img_path, (self.width, self.height))
         except Exception:
             self.image = None
 
         try:
             shot_path = ENEMY_SHOT_IMAGE_PATHS.get(color)
             if shot_path and os.path.exists(shot_path):
-                self.bullet_img = pygame.image.load(shot_path).convert_alpha()
+                self.bullet_img = assets.load_image(shot_path)
         except Exception:
             self.bullet_img = None
 
         # Movimiento horizontal aleatorio inicial
-        self.dx = random.choice([-1, 1]) * (0.5 + random.random() * 1.5)
+        self.dx = self.rng.choice([-1, 1]) * (0.5 + self.rng.random() * 1.5)
         # Cooldown para disparo: convertido desde shot_rate a frames
         # Si shot_rate es p(probabilidad/frame), 1/shot_rate ~= frames entre disparos
         try:
@@ -43,9 +64,11 @@ class Enemy(SpaceShip):
             base_cd = 200
         # Reducir cooldown por nivel para que disparen más a medida que avanza
         self.shoot_cooldown_max = max(12, base_cd - int(level * 4))
-        self.shoot_cooldown = random.randint(0, self.shoot_cooldown_max)
+        self.shoot_cooldown = self.rng.randint(0, self.shoot_cooldown_max)
+        return self
 
     def move(self, screen_width):
+        self.save_position()
         # Movimiento vertical constante
         self.y += self.speed
 
@@ -59,29 +82,66 @@ class Enemy(SpaceShip):
             self.dx *= -1
 
         # Pequeñas variaciones aleatorias para hacer el movimiento más orgánico
-        if random.random() < 0.01:
+        if self.rng.random() < 0.01:
             self.dx *= -1
 
-    def shoot(self, level=1):
-        # Disparo basado en cooldown por enemigo; llamar cada frame desde game loop
+    def shoot(self, level=1, bullets=None):
+        # Disparo basado en cooldown por enemigo; la bala se agrega a `bullets` (BulletPool)
+        bullets = self.bullets if bullets is None else bullets
         self.shoot_cooldown -= 1
         if self.shoot_cooldown <= 0:
-            bw = max(4, int(self.width * 0.12))
-            bh = max(8, int(self.height * 0.4))
+            bw, bh = shot_size(self.width, self.height)
             bx = self.x + (self.width - bw) / 2
             by = self.y + self.height
             dy = 6 + (level * 0.02)
             # reset cooldown; permitir que niveles altos disparen un poco más seguido
             self.shoot_cooldown = max(15, int(self.shoot_cooldown_max * max(0.7, 1.0 - level * 0.005)))
-            return self.shoot_bullet_dict(bx, by, bw, bh, dy)
-        return None
+            self.spawn_bullet(bullets, bx, by, bw, bh, dy)
+            return True
+        return False
+
+
+class EnemyPool:
+    """Reserva de instancias `Enemy` reutilizables entre oleadas.
+
+    `acquire` reinicializa un enemigo libre en el lugar (o crea uno si no hay);
+    `release` lo devuelve cuando sale de la oleada.
+    """
+    def __init__(self):
+        self._free = []
+        self.created = 0
+        self.reused = 0
+
+    def __len__(self):
+        return len(self._free)
+
+    def acquire(self, x, y, color='blue', level=1, rng=None):
+        if self._free:
+            self.reused += 1
+            return self._free.pop().reset(x, y, color=color, level=level, rng=rng)
+        self.created += 1
+        return Enemy(x, y, color=color, level=level, rng=rng)
+
+    def release(self, enemy):
+        self._free.append(enemy)
 
 
 class EnemyWave:
-    def __init__(self, screen_width, screen_height):
+    """Oleada de enemigos vivos.
+
+    `remove_enemy` solo marca al enemigo (O(1)); las bajas se compactan una
+    vez por frame en `compact`, conservando el orden de la lista, y recién
+    ahí vuelven a la reserva. `alive_count` se mantiene al día en cada baja.
+    """
+    def __init__(self, screen_width, screen_height, rng=None, pool=None):
+        self.rng = rng if rng is not None else random.Random()
+        # Reserva compartida de enemigos (puede sobrevivir a la oleada, p.ej. al reiniciar)
+        self.pool = pool if pool is not None else EnemyPool()
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.enemies = []
+        self.alive_count = 0
+        self._pending = 0
         # almacenar cantidad de la última oleada generada
         self.prev_amount = None
 
@@ -90,9 +150,11 @@ class EnemyWave:
         if self.prev_amount is None:
             amount = 10
         else:
-            amount = self.prev_amount + random.randint(1, 5)
+            amount = self.prev_amount + self.rng.randint(1, 5)
 
-        self.enemies = []
+        # devolver a la reserva lo que quede de la oleada anterior y reutilizar la lista
+        self.clear()
+        colors = list(ENEMY_TYPES.keys())
         # controlar ventana de aparición: nivel 1 aparece más cerca de la parte superior;
         # niveles superiores se dispersan más para aparecer poco a poco
         if level <= 1:
@@ -100,10 +162,10 @@ class EnemyWave:
         else:
             max_offset = min(2000, 300 + level * 120)
         for i in range(amount):
-            color = random.choice(list(ENEMY_TYPES.keys()))
-            x = random.randint(10, max(10, self.screen_width - ENEMY_WIDTH - 10))
-            y = random.randint(-max_offset, -50)  # aparecen por encima en distintas alturas
-            enemy = Enemy(x, y, color=color, level=level)
+            color = self.rng.choice(colors)
+            x = self.rng.randint(10, max(10, self.screen_width - ENEMY_WIDTH - 10))
+            y = self.rng.randint(-max_offset, -50)  # aparecen por encima en distintas alturas
+            enemy = self.pool.acquire(x, y, color=color, level=level, rng=self.rng)
             # Dar variación horizontal según color
             if color == 'blue':
                 enemy.dx *= 0.6
@@ -112,28 +174,100 @@ class EnemyWave:
             elif color == 'purple':
                 enemy.dx *= 1.6
 
+            enemy.wave = self
             self.enemies.append(enemy)
 
+        self.alive_count = len(self.enemies)
         # guardar la cantidad generada para la siguiente oleada
         self.prev_amount = len(self.enemies)
         return self.enemies
 
+    def clear(self):
+        """Vaciar la oleada devolviendo todos los enemigos a la reserva"""
+        for e in self.enemies:
+            e.wave = None
+            self.pool.release(e)
+        self.enemies.clear()
+        self.alive_count = 0
+        self._pending = 0
+
     def update(self, level):
-        for e in self.enemies[:]:
-            e.move(self.screen_width)
+        limit = self.screen_height + 50
+        width = self.screen_width
+        for e in self.enemies:
+            if e.wave is not self:
+                continue
+            e.move(width)
             # Si salen de la pantalla por abajo, eliminarlos de la oleada
-            if e.y > self.screen_height + 50:
-                try:
-                    self.enemies.remove(e)
-                except ValueError:
-                    pass
+            if e.y > limit:
+                self.remove_enemy(e)
+        self.compact()
+
+    def compact(self):
+        """Quitar de la lista las bajas marcadas y devolverlas a la reserva"""
+        if not self._pending:
+            return
+        keep = []
+        for e in self.enemies:
+            if e.wave is self:
+                keep.append(e)
+            else:
+                self.pool.release(e)
+        self.enemies[:] = keep
+        self._pending = 0
+
+    def fire(self, level, bullets, max_bullets, rand, legacy_rate=True):
+        """Disparo en bloque (ver firing.fire_batch); devuelve cuántos dispararon"""
+        enemies = self.enemies
+        n = len(enemies)
+        cooldown = np.fromiter((e.shoot_cooldown for e in enemies), np.float64, n)
+        cooldown_max = np.fromiter((e.shoot_cooldown_max for e in enemies), np.float64, n)
+        shot_rate = np.fromiter((e.shot_rate for e in enemies), np.float64, n)
+        fired = fire_batch(cooldown, cooldown_max, shot_rate, level, rand,
+                           max_bullets - len(bullets), legacy_rate)
+        for e, cd in zip(enemies, cooldown.astype(np.int64).tolist()):
+            e.shoot_cooldown = cd
+        if fired.size:
+            shooters = [enemies[i] for i in fired.tolist()]
+            emit_shots(bullets, np.array([e.x for e in shooters]), np.array([e.y for e in shooters]),
+                       [e.bullet_img for e in shooters], level)
+        return int(fired.size)
+
+    def rects(self):
+        """Rects de colisión, alineados con `get_alive_enemies()`"""
+        return [e.get_rect() for e in self.enemies]
+
+    def draw(self, window, alpha=1.0):
+        """Dibujar la oleada; devuelve los rects dibujados"""
+        drawn = []
+        for e in self.enemies:
+            r = e.draw(window, alpha)
+            if r:
+                drawn.append(r)
+        return drawn
 
     def get_last_wave_count(self):
         return self.prev_amount
 
+    def __len__(self):
+        return self.alive_count
+
+    def __iter__(self):
+        """Recorrer los enemigos vivos sin copiar la lista"""
+        for e in self.enemies:
+            if e.wave is self:
+                yield e
+
     def get_alive_enemies(self):
-        return [e for e in self.enemies if e.is_alive()]
+        """Lista interna de enemigos (sin copia); solo de lectura.
+
+        Tras `compact` contiene únicamente enemigos vivos.
+        """
+        return self.enemies
 
     def remove_enemy(self, enemy):
-        if enemy in self.enemies:
-            self.enemies.remove(enemy)
+        if enemy.wave is not self:
+            return
+        enemy.wave = None
+        self.alive_count -= 1
+        self._pending += 1
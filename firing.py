@@ -0,0 +1,60 @@
+import numpy as np
+
+from constants import ENEMY_WIDTH, ENEMY_HEIGHT
+
+
+def shot_size(width, height):
+    """Tamaño de la bala de un enemigo de `width` x `height` (también en Enemy.shoot)"""
+    return max(4, int(width * 0.12)), max(8, int(height * 0.4))
+
+
+def level_factor(level):
+    """Multiplicador de shot_rate por nivel (igual que en Game.enemy_random_shoot)"""
+    return max(1.0, 1.0 + (level - 1) * 0.08)
+
+
+def sampled_attempts(n):
+    """Tiradores elegidos por frame en el modo 'sampled' (aprox 1 por 8 enemigos, 1..6)"""
+    return min(6, max(1, n // 8))
+
+
+def fire_batch(cooldown, cooldown_max, shot_rate, level, rand, free, legacy_rate=True):
+    """Decidir en bloque qué enemigos disparan este frame.
+
+    `cooldown`, `cooldown_max` y `shot_rate` son arreglos alineados con la
+    oleada; `cooldown` se modifica en el lugar. `rand` trae un número
+    uniforme por enemigo (una sola llamada al RNG) y `free` es cuántas balas
+    caben todavía bajo el tope. Devuelve los índices que disparan, en orden.
+
+    Con `legacy_rate` cada cooldown avanza con la probabilidad con que el modo
+    'sampled' elegía al enemigo y aprobaba el tiro (misma tasa esperada por
+    `shot_rate`); sin él, todos los cooldowns avanzan cada frame y los que
+    llegan a 0 disparan con probabilidad `shot_rate` ajustada por nivel.
+    """
+    n = cooldown.shape[0]
+    if not n or free <= 0:
+        return np.empty(0, dtype=np.intp)
+    prob = shot_rate * level_factor(level)
+    if legacy_rate:
+        ticked = rand < prob * (sampled_attempts(n) / n)
+        cooldown -= ticked
+        ready = ticked & (cooldown <= 0)
+    else:
+        cooldown -= 1
+        np.maximum(cooldown, 0, out=cooldown)
+        ready = (cooldown <= 0) & (rand < prob)
+    fired = np.flatnonzero(ready)[:free]
+    if fired.size:
+        # reiniciar cooldown; niveles altos disparan un poco más seguido
+        reset = np.floor(cooldown_max[fired] * max(0.7, 1.0 - level * 0.005))
+        cooldown[fired] = np.maximum(15, reset)
+    return fired
+
+
+def emit_shots(bullets, xs, ys, sprites, level):
+    """Agregar a `bullets` (BulletPool) una bala por tirador"""
+    # se calcula en cada llamada: las constantes pueden cambiar (overrides de balance.py)
+    bw, bh = shot_size(ENEMY_WIDTH, ENEMY_HEIGHT)
+    bx = xs + (ENEMY_WIDTH - bw) / 2
+    by = ys + ENEMY_HEIGHT
+    bullets.spawn_many(bx, by, bw, bh, 6 + (level * 0.02), sprites)
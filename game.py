@@ -1,21 +1,67 @@
 import pygame
 import random
 import os
+import time
+import numpy as np
 from player import Player
-from enemy import EnemyWave
+from enemy import EnemyWave, EnemyPool
+from swarm import SwarmWave
 from constants import *
 from score import Puntajes
+from asset_cache import assets
+from spatial import SpatialGrid
+from collision import MaskNarrowphase
+from bullets import BulletPool
+from background import Starfield
+from textcache import TextCache
+from render import DirtyRectRenderer
+from overlays import OverlayCache
+from replay import Replay
+from profiler import FrameProfiler
+from memtrack import MemoryTracker
+from pacing import FramePacer
+from inputs import KeyboardInput, INPUT_LEFT, INPUT_RIGHT, INPUT_SHOOT
 
 
 class Game:
-    def __init__(self, font, FPS, lives, window, screen_width, screen_height, clock=None):
+    def __init__(self, font, FPS, lives, window, screen_width, screen_height, clock=None,
+                 headless=False, input_source=None, dirty_rects=None, seed=None, record_replay=False,
+                 swarm=None, scores=True, pixel_perfect=None):
+        # Modo headless: solo simulación, sin ventana, sin assets ni sonido
+        self.headless = headless
         self.font = font
-        self.hud_font = pygame.font.Font(None, HUD_FONT_SIZE)
+        # Caché de fuentes y textos renderizados (HUD, menús, overlays)
+        self.text = TextCache()
+        # Overlays translúcidos y paneles pre-compuestos
+        self.overlays = OverlayCache()
+        self.hud_font = None if headless else self.text.font(HUD_FONT_SIZE)
         self.HEIGHT = screen_height
         self.WIDTH = screen_width
         self.FPS = FPS
         self.window = window
         self.clock = clock if clock else pygame.time.Clock()
+        # Fracción del tick actual usada para interpolar el dibujo (1.0 = sin interpolar)
+        self.render_alpha = 1.0
+        # Profiler de frames (overlay de depuración); sin costo mientras está deshabilitado
+        self.profiler = FrameProfiler()
+        # Memoria/asignaciones por nivel (tracemalloc); sin costo mientras está deshabilitado
+        self.memory = MemoryTracker(enabled=MEMORY_TRACKING)
+        # Presupuesto por frame y nivel de calidad adaptativo
+        self.pacer = FramePacer(self.FPS, enabled=ADAPTIVE_QUALITY and not headless)
+        # Fuente de entrada por tick (teclado por defecto, inyectable para simulaciones)
+        self.input_source = input_source if input_source else KeyboardInput()
+
+        # RNG de la sesión: toda la aleatoriedad del juego sale de aquí
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.rng = random.Random(self.seed)
+        # Generador NumPy para el disparo en bloque (no consume del RNG de la sesión)
+        self.np_rng = np.random.default_rng(self.seed)
+        self.firing_mode = ENEMY_FIRING_MODE
+        self.firing_legacy_rate = ENEMY_FIRING_LEGACY_RATE
+        # Grabación opcional de la partida (semilla + entradas por tick); se crea
+        # más abajo, cuando ya están definidas las opciones de simulación
+        self.record_replay = record_replay
+        self.replay = None
 
         # Estado
         self.level = 1
@@ -24,8 +70,10 @@ class Game:
         self.game_over = False
         self.victory = False
         self.game_time = 0
+        # Vidas perdidas por origen (estadísticas de balance)
+        self.damage_sources = {'bullet': 0, 'collision': 0}
         # estado de menú inicial
-        self.in_menu = True
+        self.in_menu = not headless
 
         # Jugador
         self.player = Player(
@@ -36,12 +84,29 @@ class Game:
             height=PLAYER_HEIGHT,
             speed=PLAYER_SPEED,
         )
-        self.load_player_images()
+        # Colisiones por máscara: también en headless hacen falta los sprites (de
+        # ellos salen las máscaras), así un replay re-simula la misma partida
+        if pixel_perfect is None:
+            pixel_perfect = PIXEL_PERFECT_COLLISIONS
+        self.load_sprites = not headless or pixel_perfect
+        if self.load_sprites:
+            self.load_player_images()
 
         # Oleadas
-        self.enemy_wave = EnemyWave(self.WIDTH, self.HEIGHT)
+        # Reserva de enemigos compartida entre oleadas y reinicios
+        self.enemy_pool = EnemyPool()
+        # Oleada vectorizada opcional (SwarmWave) con la misma interfaz que EnemyWave
+        self.swarm = SWARM_WAVE if swarm is None else swarm
+        self.enemy_wave = self.new_enemy_wave()
         self.enemies = []
-        self.enemy_bullets = []
+        self.enemy_bullets = BulletPool(capacity=64)
+        # Índices espaciales para la broadphase de colisiones
+        self.enemy_grid = SpatialGrid(self.WIDTH, self.HEIGHT)
+        self.bullet_grid = SpatialGrid(self.WIDTH, self.HEIGHT)
+        # Narrowphase opcional por máscaras (solo para los pares que chocan por rect)
+        self.narrowphase = MaskNarrowphase(enabled=pixel_perfect)
+        if record_replay:
+            self.replay = Replay(self.seed, lives, settings=self.replay_settings())
 
         # Temporizador para pantalla de inicio de nivel
         self.level_start_duration = int(2 * self.FPS)  # 2 segundos
@@ -49,21 +114,36 @@ class Game:
 
         # UI
         self.heart_image = None
-        self.load_ui_images()
-
         self.sounds = {}
-        self.load_sounds()
-
-        # Puntajes
-        try:
-            self.score_db = Puntajes()
-        except Exception:
-            self.score_db = None
+        self.score_db = None
+        self.background = None
+        if not headless:
+            self.background = Starfield(self.WIDTH, self.HEIGHT, STARFIELD_LAYERS,
+                                        COLOR_BACKGROUND, seed=STARFIELD_SEED)
+        # Renderizado opcional por rectángulos sucios
+        if dirty_rects is None:
+            dirty_rects = DIRTY_RECT_RENDERING
+        self.renderer = None
+        if dirty_rects and not headless:
+            self.renderer = DirtyRectRenderer(self.window, self.background)
+        if not headless:
+            self.load_ui_images()
+            self.load_sounds()
+
+        # Puntajes (`scores=False` para no abrir la base, p.ej. en benchmarks)
+        if scores and not headless:
+            try:
+                self.score_db = Puntajes()
+            except Exception:
+                self.score_db = None
 
         # input nombre en game over
         self.name_input = ""
         self.name_submitted = False
         self.show_scores_overlay = False
+        # estado del guardado asíncrono: None | 'pending' | 'saved' | 'error'
+        self.score_status = None
+        self.score_ticket = None
 
         self.create_wave()
 
@@ -77,8 +157,7 @@ class Game:
     def load_ui_images(self):
         try:
             if os.path.exists(HEART_IMAGE_PATH):
-                self.heart_image = pygame.image.load(HEART_IMAGE_PATH).convert_alpha()
-                self.heart_image = pygame.transform.scale(self.heart_image, (20, 20))
+                self.heart_image = assets.load_image(HEART_IMAGE_PATH, (20, 20))
         except Exception as e:
             print("Error cargando UI:", e)
 
@@ -121,17 +200,81 @@ class Game:
         except Exception as e:
             print("Error en load_sounds:", e)
 
+    def play_sound(self, name):
+        try:
+            snd = self.sounds.get(name)
+            if snd:
+                # bajo carga se limita cuántas explosiones suenan a la vez
+                limit = self.pacer.max_explosions if name == 'explosion' else None
+                if limit is not None and snd.get_num_channels() >= limit:
+                    return
+                snd.play()
+        except Exception:
+            pass
+
+    def replay_settings(self):
+        """Opciones que cambian la simulación (se guardan en la cabecera del replay)"""
+        return {
+            'swarm': bool(self.swarm),
+            'pixel_perfect': self.narrowphase.enabled,
+            'firing_mode': self.firing_mode,
+            'firing_legacy_rate': bool(self.firing_legacy_rate),
+        }
+
+    def apply_replay_settings(self, settings):
+        """Simular con las opciones de un replay.
+
+        `swarm` y `pixel_perfect` se eligen al construir el `Game` (tipo de
+        oleada y carga de sprites para las máscaras).
+        """
+        if bool(settings['swarm']) != bool(self.swarm):
+            raise ValueError(f"El replay requiere construir el juego con swarm={settings['swarm']!r}")
+        if settings['pixel_perfect'] and not self.load_sprites:
+            raise ValueError("El replay requiere construir el juego con pixel_perfect=True")
+        self.narrowphase.enabled = settings['pixel_perfect']
+        self.firing_mode = settings['firing_mode']
+        self.firing_legacy_rate = settings['firing_legacy_rate']
+
+    def new_enemy_wave(self):
+        wave_cls = SwarmWave if self.swarm else EnemyWave
+        return wave_cls(self.WIDTH, self.HEIGHT, rng=self.rng, pool=self.enemy_pool)
+
     def create_wave(self):
-        self.enemies = self.enemy_wave.create_wave(self.level)
+        # las oleadas cargan sprites; en headless se omiten sin tocar la caché de otros Game
+        if not self.load_sprites:
+            with assets.disabled():
+                self.enemies = self.enemy_wave.create_wave(self.level)
+        else:
+            self.enemies = self.enemy_wave.create_wave(self.level)
         # Mostrar HUD de inicio de nivel y pausar acciones durante un breve tiempo
         self.level_start_timer = self.level_start_duration
         # reset contador de inicio de nivel visual
         self.name_input = ""
         self.name_submitted = False
         self.show_scores_overlay = False
+        # estado del guardado asíncrono: None | 'pending' | 'saved' | 'error'
+        self.score_status = None
+        self.score_ticket = None
 
     def handle_events(self):
         for event in pygame.event.get():
+            # teclas de depuración, disponibles en cualquier pantalla
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.key.key_code(PROFILER_TOGGLE_KEY):
+                    self.profiler.toggle()
+                    continue
+                if event.key == pygame.key.key_code(PROFILER_EXPORT_KEY):
+                    path = self.profiler.export_csv(time.strftime("profile_%Y%m%d_%H%M%S.csv"))
+                    print("Profiler exportado a", path)
+                    continue
+                if event.key == pygame.key.key_code(COLLISION_MASK_TOGGLE_KEY):
+                    # cambiaría la simulación a mitad del replay que se está grabando
+                    if self.replay is not None:
+                        print("Colisiones por máscara: no se pueden alternar mientras se graba un replay")
+                        continue
+                    self.narrowphase.toggle()
+                    print("Colisiones por máscara:", "sí" if self.narrowphase.enabled else "no")
+                    continue
             # si estamos en menú, manejar entradas de menú
             if self.in_menu:
                 if event.type == pygame.QUIT:
@@ -163,12 +306,7 @@ class Game:
                         try:
                             # submit registro
                             if getattr(self, 'scoreentry_submit_rect', None) and self.scoreentry_submit_rect.collidepoint((mx, my)):
-                                if self.name_input.strip() and self.score_db:
-                                    try:
-                                        self.score_db.add_score(self.name_input.strip(), self.kills, self.game_time, self.level, self.score)
-                                        self.name_submitted = True
-                                    except Exception:
-                                        pass
+                                self.submit_score()
                             # skip registro -> ir al panel de Game Over
                             if getattr(self, 'scoreentry_skip_rect', None) and self.scoreentry_skip_rect.collidepoint((mx, my)):
                                 self.name_submitted = True
@@ -182,12 +320,7 @@ class Game:
                         if event.key == pygame.K_BACKSPACE:
                             self.name_input = self.name_input[:-1]
                         elif event.key == pygame.K_RETURN:
-                            if self.name_input.strip() and self.score_db:
-                                try:
-                                    self.score_db.add_score(self.name_input.strip(), self.kills, self.game_time, self.level, self.score)
-                                    self.name_submitted = True
-                                except Exception:
-                                    pass
+                            self.submit_score()
                         else:
                             if len(self.name_input) < 20 and event.unicode.isprintable():
                                 self.name_input += event.unicode
@@ -209,54 +342,110 @@ class Game:
                             pass
             if event.type == pygame.QUIT:
                 return False
+            if self.input_source.handle_event(event, self):
+                continue
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and not self.game_over and not self.victory:
-                    self.player.shoot()
-                elif event.key == pygame.K_r and (self.game_over or self.victory):
+                if event.key == pygame.K_r and (self.game_over or self.victory):
                     self.reset_game()
                 elif event.key == pygame.K_ESCAPE:
                     return False
         return True
 
+    def submit_score(self):
+        """Encolar el puntaje en el escritor de fondo (no bloquea el frame)"""
+        if not (self.name_input.strip() and self.score_db):
+            return
+        try:
+            self.score_ticket = self.score_db.submit_score(
+                self.name_input.strip(), self.kills, self.game_time, self.level, self.score,
+                callback=self.on_score_saved,
+            )
+            self.score_status = 'pending'
+            self.name_submitted = True
+        except Exception:
+            pass
+
+    def on_score_saved(self, ticket, ok):
+        # ignorar confirmaciones de partidas anteriores (p.ej. tras reiniciar)
+        if ticket == self.score_ticket:
+            self.score_status = 'saved' if ok else 'error'
+
+    def poll_score_db(self):
+        if self.score_db:
+            try:
+                self.score_db.poll_completed()
+            except Exception:
+                pass
+
     def update(self):
         if self.game_over or self.victory:
             return
+        if self.memory.enabled:
+            self.memory.tick(self)
+
+        prof = self.profiler if self.profiler.enabled else None
+        if prof:
+            prof.begin()
+        inputs = self.input_source.read(self)
+        if self.replay is not None:
+            self.replay.record(inputs)
+        self.player.save_position()
+        # el disparo se procesa incluso durante la introducción del nivel
+        if inputs & INPUT_SHOOT:
+            self.player.shoot()
 
         # Si estamos en la introducción del nivel, contar el timer y pausar actualizaciones
         if getattr(self, 'level_start_timer', 0) > 0:
             self.level_start_timer -= 1
+            if prof:
+                prof.mark('input')
             return
 
         self.game_time += 1 / self.FPS
 
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_LEFT]:
+        if inputs & INPUT_LEFT:
             self.player.move_left(self.WIDTH)
-        if keys[pygame.K_RIGHT]:
+        if inputs & INPUT_RIGHT:
             self.player.move_right(self.WIDTH)
+        if prof:
+            prof.mark('input')
 
         self.player.update(self.WIDTH)
+        if prof:
+            prof.mark('player')
         self.enemy_wave.update(self.level)
+        if prof:
+            prof.mark('enemy_wave')
 
         # actualizar balas enemigas
         self.update_enemy_bullets()
+        if prof:
+            prof.mark('enemy_bullets')
 
         # enemigos disparan
         self.enemy_random_shoot()
+        if prof:
+            prof.mark('enemy_shoot')
 
         # colisiones
         self.check_collisions()
+        # compactar una sola vez las bajas del frame
+        self.enemy_wave.compact()
+        if prof:
+            prof.mark('collisions')
 
         # condiciones de juego
         self.check_game_conditions()
+        if prof:
+            prof.mark('conditions')
 
     def update_enemy_bullets(self):
-        for b in self.enemy_bullets[:]:
-            b['y'] += b.get('dy', 6)
-            if b['y'] > self.HEIGHT + 50:
-                self.enemy_bullets.remove(b)
+        self.enemy_bullets.update(max_y=self.HEIGHT + 50)
 
     def enemy_random_shoot(self):
+        if self.firing_mode == 'batched':
+            self.enemy_batch_shoot()
+            return
         # Limitar cuántos enemigos intentan disparar por frame y tope de balas en pantalla
         alive = self.enemy_wave.get_alive_enemies()
         if not alive:
@@ -264,7 +453,7 @@ class Game:
 
         # número de intentos de disparo por frame (aprox 1 por 6 enemigos, mínimo 1 y máximo 6)
         max_attempts = min(6, max(1, len(alive) // 8))
-        shooters = random.sample(alive, k=min(len(alive), max_attempts))
+        shooters = self.rng.sample(alive, k=min(len(alive), max_attempts))
 
         # tope global de balas enemigas en pantalla (aumenta por nivel)
         max_enemy_bullets = min(60, 5 + self.level * 2)
@@ -276,37 +465,47 @@ class Game:
             try:
                 base_prob = getattr(shooter, 'shot_rate', 0.01)
                 adj_prob = base_prob * max(1.0, 1.0 + (self.level - 1) * 0.08)
-                if random.random() < adj_prob:
-                    b = shooter.shoot(self.level)
-                else:
-                    b = None
+                if self.rng.random() < adj_prob:
+                    shooter.shoot(self.level, self.enemy_bullets)
             except Exception:
-                b = shooter.shoot(self.level)
-            if b:
-                self.enemy_bullets.append(b)
+                shooter.shoot(self.level, self.enemy_bullets)
+
+    def enemy_batch_shoot(self):
+        # Cooldowns y tiradas de todos los enemigos en un paso (ver firing.py)
+        n = self.enemy_wave.alive_count
+        if not n:
+            return
+        max_enemy_bullets = min(60, 5 + self.level * 2)
+        self.enemy_wave.fire(self.level, self.enemy_bullets, max_enemy_bullets,
+                             self.np_rng.random(n), self.firing_legacy_rate)
 
     def check_collisions(self):
         player_rect = self.player.get_rect()
+        player_mask = self.player.mask
         alive_enemies = self.enemy_wave.get_alive_enemies()
-
-        # balas jugador -> enemigos
-        for bi in range(len(self.player.bullets) - 1, -1, -1):
-            bullet = self.player.bullets[bi]
-            br = pygame.Rect(bullet['x'], bullet['y'], bullet['width'], bullet['height'])
-            for e in alive_enemies[:]:
-                er = e.get_rect()
-                if br.colliderect(er):
+        narrow = self.narrowphase
+        narrow.begin_tick()
+
+        # broadphase: reconstruir la grilla de enemigos tras EnemyWave.update
+        grid = self.enemy_grid
+        grid.rebuild(self.enemy_wave.rects())
+        enemy_rects = grid.rects
+
+        # balas jugador -> enemigos (solo candidatos de celdas cercanas, en orden de lista)
+        bullet_rects = self.player.bullets.rects()
+        bullet_img = self.player.bullet_img
+        for bi in range(len(bullet_rects) - 1, -1, -1):
+            br = bullet_rects[bi]
+            for ei in grid.query(br):
+                if br.colliderect(enemy_rects[ei]):
+                    e = alive_enemies[ei]
+                    if not narrow.bullet_overlap(br, bullet_img, enemy_rects[ei], e.mask):
+                        continue
                     # remover bala
-                    if bi < len(self.player.bullets):
-                        self.player.bullets.pop(bi)
+                    self.player.bullets.remove(bi)
                     e.take_damage(25)
                     # reproducir sonido de explosión si está disponible
-                    try:
-                        snd = self.sounds.get('explosion')
-                        if snd:
-                            snd.play()
-                    except Exception:
-                        pass
+                    self.play_sound('explosion')
                     if not e.is_alive():
                         self.enemy_wave.remove_enemy(e)
                         self.score += e.base_score * self.level
@@ -314,37 +513,39 @@ class Game:
                     break
 
         # balas enemigas -> jugador
-        for b in self.enemy_bullets[:]:
-            br = pygame.Rect(b['x'], b['y'], b['width'], b['height'])
-            if br.colliderect(player_rect):
-                self.enemy_bullets.remove(b)
+        bullet_grid = self.bullet_grid
+        bullet_grid.rebuild(self.enemy_bullets.rects())
+        for bi in bullet_grid.query(player_rect):
+            br = bullet_grid.rects[bi]
+            if br.colliderect(player_rect) and \
+                    narrow.bullet_overlap(br, self.enemy_bullets.sprite(bi), player_rect, player_mask):
+                self.enemy_bullets.remove(bi)
                 self.player.take_damage(1)
+                self.damage_sources['bullet'] += 1
                 # reproducir sonido de explosión si está disponible
-                try:
-                    snd = self.sounds.get('explosion')
-                    if snd:
-                        snd.play()
-                except Exception:
-                    pass
+                self.play_sound('explosion')
                 break
 
         # colision directa enemigos -> jugador
-        for e in alive_enemies[:]:
+        for ei in grid.query(player_rect):
             # Si un enemigo choca con el jugador, quitarle vida al jugador
-            if e.get_rect().colliderect(player_rect):
-                self.enemy_wave.remove_enemy(e)
+            if enemy_rects[ei].colliderect(player_rect) and \
+                    narrow.overlap(enemy_rects[ei], alive_enemies[ei].mask, player_rect, player_mask):
+                self.enemy_wave.remove_enemy(alive_enemies[ei])
                 self.player.take_damage(1)
+                self.damage_sources['collision'] += 1
                 # No terminar el juego aquí; check_game_conditions decidirá si las vidas se agotaron
 
     def check_game_conditions(self):
         if not self.player.is_alive():
             self.game_over = True
             return
-        alive = self.enemy_wave.get_alive_enemies()
-        if len(alive) == 0:
+        if self.enemy_wave.alive_count == 0:
             self.level_up()
 
     def level_up(self):
+        if self.memory.enabled:
+            self.memory.on_level_up(self, self.level)
         self.level += 1
         # aumentar la dificultad del jugador (si aplica)
         try:
@@ -363,60 +564,86 @@ class Game:
         # generar la nueva oleada (juego infinito)
         self.create_wave()
 
-    def reset_game(self):
+    def reset_game(self, seed=None):
+        # nueva semilla por partida para que cada una sea reproducible por separado
+        self.seed = seed if seed is not None else self.rng.getrandbits(63)
+        self.rng.seed(self.seed)
+        self.np_rng = np.random.default_rng(self.seed)
+        if self.record_replay:
+            self.replay = Replay(self.seed, self.player.max_health, settings=self.replay_settings())
+        if self.memory.enabled:
+            self.memory.on_reset()
         self.level = 1
         self.score = 0
         self.kills = 0
         self.game_over = False
         self.victory = False
         self.game_time = 0
+        self.damage_sources = {'bullet': 0, 'collision': 0}
         self.player.health = self.player.max_health
         self.player.x = self.WIDTH // 2 - PLAYER_WIDTH // 2
         self.player.y = self.HEIGHT - 80
-        self.player.bullets = []
+        self.player.save_position()
+        self.player.bullets.clear()
         self.player.shoot_cooldown_max = PLAYER_SHOOT_COOLDOWN
-        self.enemy_bullets = []
-        self.enemy_wave = EnemyWave(self.WIDTH, self.HEIGHT)
+        # el resto del estado del jugador vuelve al inicial (partidas reproducibles)
+        self.player.shoot_cooldown = 0
+        self.player.speed = PLAYER_SPEED
+        self.player.current_ammo = self.player.magazine_size
+        self.player.reload_counter = 0
+        self.enemy_bullets.clear()
+        self.enemy_wave.clear()
+        self.enemy_wave = self.new_enemy_wave()
         self.create_wave()
         # reset HUD timer para el primer nivel
         self.level_start_timer = self.level_start_duration
         self.name_input = ""
         self.name_submitted = False
         self.show_scores_overlay = False
+        # estado del guardado asíncrono: None | 'pending' | 'saved' | 'error'
+        self.score_status = None
+        self.score_ticket = None
 
     def draw(self):
-        self.window.fill(COLOR_BACKGROUND)
-        # estrellas
-        random.seed(42)
-        for i in range(80):
-            x = random.randint(0, self.WIDTH)
-            y = random.randint(0, self.HEIGHT)
-            pygame.draw.circle(self.window, (200, 200, 200), (x, y), 1)
+        if self.headless:
+            return
+        prof = self.profiler if self.profiler.enabled else None
+        if prof:
+            prof.begin()
+        # fondo pre-renderizado (color + estrellas) en un solo blit; liso en calidad baja
+        if self.pacer.skip_background:
+            self.window.fill(COLOR_BACKGROUND)
+        else:
+            self.background.update()
+            self.background.draw(self.window)
+        if prof:
+            prof.mark('background')
 
         if not self.game_over and not self.victory:
-            self.player.draw(self.window)
-            self.player.draw_bullets(self.window)
+            alpha = self.render_alpha
+            self.player.draw(self.window, alpha)
+            self.player.draw_bullets(self.window, alpha)
 
-            for e in self.enemy_wave.enemies:
-                e.draw(self.window)
+            self.enemy_wave.draw(self.window, alpha)
 
-            for b in self.enemy_bullets:
-                if b.get('img'):
-                    self.window.blit(b['img'], (b['x'], b['y']))
-                else:
-                    pygame.draw.rect(self.window, (255, 100, 0), (b['x'], b['y'], b['width'], b['height']))
+            self.enemy_bullets.draw(self.window, (255, 100, 0), alpha)
+        if prof:
+            prof.mark('sprites')
         # Si estamos mostrando la pantalla de inicio de nivel, oscurecer y dibujar HUD
         if getattr(self, 'level_start_timer', 0) > 0:
-            overlay = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
+            overlay = self.overlays.tint((self.WIDTH, self.HEIGHT), (0, 0, 0, 150))
             self.window.blit(overlay, (0, 0))
             # Texto de nivel y advertencia con emojis
-            lvl_text = self.font.render(f"LEVEL {self.level}", True, (255, 255, 0))
-            warn_text = self.hud_font.render("⚠️👾 CUIDADO!! Viene una oleada de aliens 👾⚠️", True, (255, 180, 0))
+            lvl_text = self.text.render(self.font, f"LEVEL {self.level}", (255, 255, 0))
+            warn_text = self.text.render(self.hud_font, "⚠️👾 CUIDADO!! Viene una oleada de aliens 👾⚠️", (255, 180, 0))
             self.window.blit(lvl_text, (self.WIDTH // 2 - lvl_text.get_width() // 2, self.HEIGHT // 2 - 60))
             self.window.blit(warn_text, (self.WIDTH // 2 - warn_text.get_width() // 2, self.HEIGHT // 2))
+        if prof:
+            prof.mark('overlays')
 
         self.draw_hud()
+        if prof:
+            prof.mark('hud')
 
         # Mostrar pantalla de Game Over / Victory cuando corresponda
         if self.game_over:
@@ -428,6 +655,87 @@ class Game:
                 self.draw_scores_overlay()
         elif self.victory:
             self.draw_victory()
+        if prof:
+            prof.mark('overlays')
+        self.draw_profiler()
+
+    def draw_profiler(self):
+        """Overlay de depuración con tiempos por fase; devuelve su rect o None"""
+        if not self.profiler.enabled:
+            return None
+        return self.profiler.draw(self.window, self.hud_font)
+
+    def end_profiler_frame(self, frame_time):
+        if not self.profiler.enabled:
+            return
+        self.profiler.end_frame(frame_time, {
+            'enemies': self.enemy_wave.alive_count,
+            'player_bullets': len(self.player.bullets),
+            'enemy_bullets': len(self.enemy_bullets),
+            'narrowphase': self.narrowphase.tick_pairs,
+            'quality': self.pacer.tier,
+        })
+
+    def hud_rects(self):
+        """Regiones fijas del HUD (columna izquierda y vidas/munición a la derecha)"""
+        return [pygame.Rect(0, 0, 260, 130), pygame.Rect(self.WIDTH - 370, 0, 370, 50)]
+
+    def screen_state_key(self):
+        """Clave de pantallas estáticas; None mientras hay juego en movimiento"""
+        if self.in_menu:
+            return ('menu',)
+        if self.game_over:
+            return ('over', self.name_submitted, self.name_input, self.show_scores_overlay, self.score_status,
+                    self.score, self.kills, self.level)
+        if self.victory:
+            return ('victory', self.score, self.level)
+        if getattr(self, 'level_start_timer', 0) > 0:
+            p = self.player
+            return ('intro', self.level, p.x, p.y, p.health, p.current_ammo, len(p.bullets))
+        return None
+
+    def draw_dirty(self):
+        """Dibujar y enviar solo las áreas que cambiaron (DirtyRectRenderer)"""
+        r = self.renderer
+        key = self.screen_state_key()
+        if key is not None:
+            r.present_static(key, self.draw_menu if self.in_menu else self.draw)
+            return
+        alpha = self.render_alpha
+        prof = self.profiler if self.profiler.enabled else None
+        if prof:
+            prof.begin()
+        r.begin_frame()
+        if prof:
+            prof.mark('background')
+        r.mark(self.player.draw(self.window, alpha))
+        r.mark_all(self.player.draw_bullets(self.window, alpha))
+        r.mark_all(self.enemy_wave.draw(self.window, alpha))
+        r.mark_all(self.enemy_bullets.draw(self.window, (255, 100, 0), alpha))
+        if prof:
+            prof.mark('sprites')
+        # el HUD se marca siempre, así begin_frame lo restaura en el siguiente frame
+        self.draw_hud()
+        r.mark_all(self.hud_rects())
+        if prof:
+            prof.mark('hud')
+        r.mark(self.draw_profiler())
+        r.end_frame()
+
+    def present(self):
+        """Dibujar el frame actual y enviarlo a la pantalla"""
+        if self.renderer:
+            if self.profiler.enabled and self.screen_state_key() is not None:
+                # el overlay cambia cada frame: las pantallas estáticas se redibujan
+                self.renderer.invalidate()
+            self.draw_dirty()
+            return
+        if self.in_menu:
+            # dibujar menú especial
+            self.draw_menu()
+        else:
+            self.draw()
+        pygame.display.flip()
 
     def draw_menu(self):
         # Fondo
@@ -441,9 +749,9 @@ class Game:
             pass
 
         # Título grande
-        title_font = pygame.font.Font(None, 64)
-        title = title_font.render("Space Invader 2026", True, (255, 255, 0))
-        subtitle = self.hud_font.render("    (Millenium)", True, (200, 200, 200))
+        title_font = self.text.font(64)
+        title = self.text.render(title_font, "Space Invader 2026", (255, 255, 0))
+        subtitle = self.text.render(self.hud_font, "    (Millenium)", (200, 200, 200))
         self.window.blit(title, (self.WIDTH // 2 - title.get_width() // 2, 160))
         self.window.blit(subtitle, (self.WIDTH // 2 - subtitle.get_width() // 2, 220))
 
@@ -457,23 +765,22 @@ class Game:
         pygame.draw.rect(self.window, (50, 150, 50), start_rect)
         pygame.draw.rect(self.window, (150, 50, 50), exit_rect)
 
-        start_text = self.hud_font.render("Iniciar Juego", True, (255, 255, 255))
-        exit_text = self.hud_font.render("Salir", True, (255, 255, 255))
+        start_text = self.text.render(self.hud_font, "Iniciar Juego", (255, 255, 255))
+        exit_text = self.text.render(self.hud_font, "Salir", (255, 255, 255))
         self.window.blit(start_text, (start_rect.centerx - start_text.get_width() // 2, start_rect.centery - start_text.get_height() // 2))
         self.window.blit(exit_text, (exit_rect.centerx - exit_text.get_width() // 2, exit_rect.centery - exit_text.get_height() // 2))
 
         # Ayuda pequeña
-        hint = self.hud_font.render("Presiona Enter o haz click en Iniciar", True, (180, 180, 180))
+        hint = self.text.render(self.hud_font, "Presiona Enter o haz click en Iniciar", (180, 180, 180))
         self.window.blit(hint, (self.WIDTH // 2 - hint.get_width() // 2, 430))
 
         # Mostrar la mayor puntuación en el menú, si existe
         try:
             if self.score_db:
-                rows = self.score_db.get_all_scores()
-                if rows:
-                    top = max(rows, key=lambda r: r[4])
+                top = self.score_db.get_best_score()
+                if top:
                     name, kills, play_time, level, score, ts = top
-                    top_txt = self.hud_font.render(f"Mayor puntuación: {name}   {score}   (Nivel {level})", True, (220, 220, 220))
+                    top_txt = self.text.render(self.hud_font, f"Mayor puntuación: {name}   {score}   (Nivel {level})", (220, 220, 220))
                     self.window.blit(top_txt, (self.WIDTH // 2 - top_txt.get_width() // 2, self.HEIGHT - 60))
         except Exception:
             pass
@@ -485,19 +792,21 @@ class Game:
                 self.draw_game_over()
         elif self.victory:
             self.draw_victory()
+        self.draw_profiler()
 
     def draw_hud(self):
         y_offset = 10
+        aa = self.pacer.antialias
         # Left column: Score / Level / Kills / Time
-        score_text = self.hud_font.render(f"Score: {self.score}", True, COLOR_TEXT)
+        score_text = self.text.render(self.hud_font, f"Score: {self.score}", COLOR_TEXT, aa)
         self.window.blit(score_text, (10, y_offset))
-        level_text = self.hud_font.render(f"Level: {self.level}", True, COLOR_TEXT)
+        level_text = self.text.render(self.hud_font, f"Level: {self.level}", COLOR_TEXT, aa)
         self.window.blit(level_text, (10, y_offset + 30))
-        kills_text = self.hud_font.render(f"Kills: {self.kills}", True, COLOR_TEXT)
+        kills_text = self.text.render(self.hud_font, f"Kills: {self.kills}", COLOR_TEXT, aa)
         self.window.blit(kills_text, (10, y_offset + 60))
         minutes = int(self.game_time // 60)
         seconds = int(self.game_time % 60)
-        time_text = self.hud_font.render(f"Time: {minutes:02d}:{seconds:02d}", True, COLOR_TEXT)
+        time_text = self.text.render(self.hud_font, f"Time: {minutes:02d}:{seconds:02d}", COLOR_TEXT, aa)
         self.window.blit(time_text, (10, y_offset + 90))
 
         # Right column: Lives and Ammo aligned to top (same y_offset)
@@ -518,7 +827,7 @@ class Game:
                                     [(hearts_x + i * 30, hearts_y + 14),
                                      (hearts_x + i * 30 + 32, hearts_y + 14),
                                      (hearts_x + i * 30 + 16, hearts_y + 30)])
-        lives_label = self.hud_font.render(f"Lives:", True, COLOR_TEXT)
+        lives_label = self.text.render(self.hud_font, f"Lives:", COLOR_TEXT, self.pacer.antialias)
         self.window.blit(lives_label, (hearts_x - 80, hearts_y))
 
     def draw_bullets_hud(self, y_offset):
@@ -527,11 +836,13 @@ class Game:
         bullets_y = y_offset
         max_bullets = getattr(self.player, 'magazine_size', self.player.max_bullets if hasattr(self.player, 'max_bullets') else 5)
         current_bullets = getattr(self.player, 'current_ammo', len(self.player.bullets))
+        # variantes normal/atenuada precalculadas en asset_cache
         b_img = None
+        dark = None
         try:
-            b_img = self.player.bullet_img
-            if b_img:
-                b_img = pygame.transform.scale(b_img, (12, 18))
+            if self.player.bullet_img:
+                b_img = assets.variant(self.player.bullet_img, (12, 18))
+                dark = assets.variant(self.player.bullet_img, (12, 18), tint=(80, 80, 80, 120))
         except Exception:
             b_img = None
         for i in range(max_bullets):
@@ -542,84 +853,81 @@ class Game:
                 else:
                     pygame.draw.rect(self.window, (255, 255, 0), (slot_x, bullets_y, 12, 18))
             else:
-                if b_img:
-                    dark = b_img.copy()
-                    dark.fill((80, 80, 80, 120), special_flags=pygame.BLEND_RGBA_MULT)
+                if dark:
                     self.window.blit(dark, (slot_x, bullets_y))
                 else:
                     pygame.draw.rect(self.window, (100, 100, 0), (slot_x, bullets_y, 12, 18))
-        bullets_label = self.hud_font.render(f"Ammo:", True, COLOR_TEXT)
+        bullets_label = self.text.render(self.hud_font, f"Ammo:", COLOR_TEXT, self.pacer.antialias)
         self.window.blit(bullets_label, (bullets_x - 70, bullets_y))
 
     def draw_game_over(self):
         # Full-screen dark overlay
-        overlay = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
+        overlay = self.overlays.tint((self.WIDTH, self.HEIGHT), (0, 0, 0, 220))
         self.window.blit(overlay, (0, 0))
 
-        # Panel central
+        # Panel central (marco, título, resumen y botones pre-compuestos)
         panel_w, panel_h = min(760, self.WIDTH - 80), min(420, self.HEIGHT - 120)
         panel_x = self.WIDTH // 2 - panel_w // 2
         panel_y = self.HEIGHT // 2 - panel_h // 2
-        panel = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
-        pygame.draw.rect(self.window, (18, 18, 18), panel)
-        pygame.draw.rect(self.window, (200, 200, 200), panel, 2)
-
         pad = 20
-        y = panel_y + pad
-        # Title
-        game_over_text = self.font.render("GAME OVER", True, (220, 40, 40))
-        self.window.blit(game_over_text, (panel_x + panel_w // 2 - game_over_text.get_width() // 2, y))
-        y += game_over_text.get_height() + 12
-
-        # Summary (centered)
-        score_text = self.hud_font.render(f"Score: {self.score}", True, COLOR_TEXT)
-        level_text = self.hud_font.render(f"Level Reached: {self.level}", True, COLOR_TEXT)
-        kills_text = self.hud_font.render(f"Enemies Killed: {self.kills}", True, COLOR_TEXT)
-        time_text = self.hud_font.render(f"Time: {int(self.game_time)}s", True, COLOR_TEXT)
-        col_x = panel_x + pad
-        self.window.blit(score_text, (col_x, y))
-        self.window.blit(kills_text, (col_x + 320, y))
-        y += score_text.get_height() + 8
-        self.window.blit(level_text, (col_x, y))
-        self.window.blit(time_text, (col_x + 320, y))
-        y += level_text.get_height() + 18
 
         # Bottom buttons: View Scores / Restart / Exit
         btn_w, btn_h = 160, 44
         gap = 18
         total_w = btn_w * 3 + gap * 2
-        start_x = panel_x + panel_w // 2 - total_w // 2
-
-        view_rect = pygame.Rect(start_x, panel_y + panel_h - btn_h - pad, btn_w, btn_h)
-        restart_rect = pygame.Rect(start_x + (btn_w + gap), panel_y + panel_h - btn_h - pad, btn_w, btn_h)
-        exit_rect = pygame.Rect(start_x + 2 * (btn_w + gap), panel_y + panel_h - btn_h - pad, btn_w, btn_h)
-
-        self.gameover_view_rect = view_rect
-        self.gameover_restart_rect = restart_rect
-        self.gameover_exit_rect = exit_rect
-
-        pygame.draw.rect(self.window, (120, 120, 120), view_rect)
-        pygame.draw.rect(self.window, (60, 140, 60), restart_rect)
-        pygame.draw.rect(self.window, (140, 60, 60), exit_rect)
-
-        view_label = self.hud_font.render("Ver puntajes", True, (255, 255, 255))
-        restart_label = self.hud_font.render("Reiniciar", True, (255, 255, 255))
-        exit_label = self.hud_font.render("Salir", True, (255, 255, 255))
-
-        self.window.blit(view_label, (view_rect.centerx - view_label.get_width() // 2, view_rect.centery - view_label.get_height() // 2))
-        self.window.blit(restart_label, (restart_rect.centerx - restart_label.get_width() // 2, restart_rect.centery - restart_label.get_height() // 2))
-        self.window.blit(exit_label, (exit_rect.centerx - exit_label.get_width() // 2, exit_rect.centery - exit_label.get_height() // 2))
-
-        # Confirmation message if score was saved
-        if self.name_submitted:
-            ok = self.hud_font.render("Tus datos fueron guardados.", True, (0, 255, 0))
-            self.window.blit(ok, (panel_x + panel_w // 2 - ok.get_width() // 2, panel_y + panel_h - btn_h - pad - 36))
+        start_x = panel_w // 2 - total_w // 2
+        btn_y = panel_h - btn_h - pad
+        buttons = [
+            (pygame.Rect(start_x, btn_y, btn_w, btn_h), (120, 120, 120), "Ver puntajes"),
+            (pygame.Rect(start_x + (btn_w + gap), btn_y, btn_w, btn_h), (60, 140, 60), "Reiniciar"),
+            (pygame.Rect(start_x + 2 * (btn_w + gap), btn_y, btn_w, btn_h), (140, 60, 60), "Salir"),
+        ]
+        self.gameover_view_rect = buttons[0][0].move(panel_x, panel_y)
+        self.gameover_restart_rect = buttons[1][0].move(panel_x, panel_y)
+        self.gameover_exit_rect = buttons[2][0].move(panel_x, panel_y)
+
+        def build(surface):
+            surface.fill((18, 18, 18))
+            pygame.draw.rect(surface, (200, 200, 200), surface.get_rect(), 2)
+            y = pad
+            # Title
+            game_over_text = self.text.render(self.font, "GAME OVER", (220, 40, 40))
+            surface.blit(game_over_text, (panel_w // 2 - game_over_text.get_width() // 2, y))
+            y += game_over_text.get_height() + 12
+
+            # Summary (centered)
+            score_text = self.text.render(self.hud_font, f"Score: {self.score}", COLOR_TEXT)
+            level_text = self.text.render(self.hud_font, f"Level Reached: {self.level}", COLOR_TEXT)
+            kills_text = self.text.render(self.hud_font, f"Enemies Killed: {self.kills}", COLOR_TEXT)
+            time_text = self.text.render(self.hud_font, f"Time: {int(self.game_time)}s", COLOR_TEXT)
+            surface.blit(score_text, (pad, y))
+            surface.blit(kills_text, (pad + 320, y))
+            y += score_text.get_height() + 8
+            surface.blit(level_text, (pad, y))
+            surface.blit(time_text, (pad + 320, y))
+
+            for rect, color, label in buttons:
+                pygame.draw.rect(surface, color, rect)
+                txt = self.text.render(self.hud_font, label, (255, 255, 255))
+                surface.blit(txt, (rect.centerx - txt.get_width() // 2, rect.centery - txt.get_height() // 2))
+
+        key = ('game_over', self.score, self.level, self.kills, int(self.game_time))
+        self.window.blit(self.overlays.panel(key, (panel_w, panel_h), build), (panel_x, panel_y))
+
+        # Confirmation message once the score commit finished
+        status_msg = None
+        if self.score_status == 'saved':
+            status_msg = self.text.render(self.hud_font, "Tus datos fueron guardados.", (0, 255, 0))
+        elif self.score_status == 'pending':
+            status_msg = self.text.render(self.hud_font, "Guardando puntaje...", (200, 200, 200))
+        elif self.score_status == 'error':
+            status_msg = self.text.render(self.hud_font, "No se pudo guardar el puntaje.", (255, 100, 100))
+        if status_msg:
+            self.window.blit(status_msg, (panel_x + panel_w // 2 - status_msg.get_width() // 2, panel_y + panel_h - btn_h - pad - 36))
 
     def draw_score_entry(self):
         # Full-screen dark overlay
-        overlay = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
+        overlay = self.overlays.tint((self.WIDTH, self.HEIGHT), (0, 0, 0, 200))
         self.window.blit(overlay, (0, 0))
 
         # Panel central más compacto
@@ -632,12 +940,12 @@ class Game:
 
         pad = 16
         y = panel_y + pad
-        title = self.font.render("REGISTRAR PUNTAJE", True, (255, 215, 0))
+        title = self.text.render(self.font, "REGISTRAR PUNTAJE", (255, 215, 0))
         self.window.blit(title, (panel_x + panel_w // 2 - title.get_width() // 2, y))
         y += title.get_height() + 12
 
         # Summary
-        score_text = self.hud_font.render(f"Score: {self.score}    Level: {self.level}    Kills: {self.kills}", True, COLOR_TEXT)
+        score_text = self.text.render(self.hud_font, f"Score: {self.score}    Level: {self.level}    Kills: {self.kills}", COLOR_TEXT)
         self.window.blit(score_text, (panel_x + pad, y))
         y += score_text.get_height() + 16
 
@@ -648,26 +956,25 @@ class Game:
         inp_rect = pygame.Rect(inp_x, inp_y, inp_w, inp_h)
         pygame.draw.rect(self.window, (30, 30, 30), inp_rect)
         pygame.draw.rect(self.window, (160, 160, 160), inp_rect, 2)
-        name_label = self.hud_font.render("Nombre:", True, COLOR_TEXT)
+        name_label = self.text.render(self.hud_font, "Nombre:", COLOR_TEXT)
         self.window.blit(name_label, (inp_x, inp_y - 26))
-        input_text = self.hud_font.render(self.name_input if self.name_input else "", True, COLOR_TEXT)
+        input_text = self.text.render(self.hud_font, self.name_input if self.name_input else "", COLOR_TEXT)
         self.window.blit(input_text, (inp_x + 8, inp_y + 6))
         y = inp_y + inp_h + 16
 
         # Instrucción: presionar Enter para registrar (solo input + Enter)
-        hint = self.hud_font.render("Presiona Enter para registrar tu nombre (R = Reiniciar)", True, (200, 200, 200))
+        hint = self.text.render(self.hud_font, "Presiona Enter para registrar tu nombre (R = Reiniciar)", (200, 200, 200))
         self.window.blit(hint, (panel_x + panel_w // 2 - hint.get_width() // 2, y))
         # No dibujamos botones; la entrada se realiza con teclado
 
 
     def draw_victory(self):
-        overlay = pygame.Surface((self.WIDTH, self.HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 50, 0, 200))
+        overlay = self.overlays.tint((self.WIDTH, self.HEIGHT), (0, 50, 0, 200))
         self.window.blit(overlay, (0, 0))
-        victory_text = self.font.render("VICTORY!", True, (0, 255, 0))
-        score_text = self.font.render(f"Final Score: {self.score}", True, COLOR_TEXT)
-        level_text = self.font.render(f"Level Completed: {self.level}", True, COLOR_TEXT)
-        restart_text = self.hud_font.render("Press R to play again or ESC to quit", True, COLOR_TEXT)
+        victory_text = self.text.render(self.font, "VICTORY!", (0, 255, 0))
+        score_text = self.text.render(self.font, f"Final Score: {self.score}", COLOR_TEXT)
+        level_text = self.text.render(self.font, f"Level Completed: {self.level}", COLOR_TEXT)
+        restart_text = self.text.render(self.hud_font, "Press R to play again or ESC to quit", COLOR_TEXT)
         self.window.blit(victory_text,
                          (self.WIDTH // 2 - victory_text.get_width() // 2, self.HEIGHT // 2 - 100))
         self.window.blit(score_text,
@@ -680,20 +987,19 @@ class Game:
     def draw_scores_overlay(self):
         # Full black background for scores
         self.window.fill((0, 0, 0))
-        title = self.font.render("PUNTAJES", True, (255, 215, 0))
+        title = self.text.render(self.font, "PUNTAJES", (255, 215, 0))
         self.window.blit(title, (self.WIDTH // 2 - title.get_width() // 2, 20))
 
         if not self.score_db:
-            err = self.hud_font.render("Base de datos no disponible.", True, (255, 100, 100))
+            err = self.text.render(self.hud_font, "Base de datos no disponible.", (255, 100, 100))
             self.window.blit(err, (self.WIDTH // 2 - err.get_width() // 2, 120))
             return
 
-        # obtener todos y ordenar por score descendente
-        rows = self.score_db.get_all_scores()
-        rows_sorted = sorted(rows, key=lambda r: r[4], reverse=True)
+        # mejores 20 por score descendente (consulta indexada y cacheada)
+        rows_sorted = self.score_db.get_top_scores(20)
 
         # encabezado
-        header = self.hud_font.render("#  Name          Kills   Time   Level   Score", True, (200, 200, 200))
+        header = self.text.render(self.hud_font, "#  Name          Kills   Time   Level   Score", (200, 200, 200))
         margin_x = 60
         y = 100
         self.window.blit(header, (margin_x, y))
@@ -705,28 +1011,98 @@ class Game:
             name, kills, play_time, level, score, ts = r
             rank = idx + 1
             line = f"{rank:2d}. {name[:12]:12}    {kills:3d}    {int(play_time):4d}s    {level:3d}    {score:6d}"
-            txt = self.hud_font.render(line, True, (220, 220, 220))
+            txt = self.text.render(self.hud_font, line, (220, 220, 220))
             self.window.blit(txt, (margin_x, y))
             y += 28
 
         # close button bottom-right
         close_rect = pygame.Rect(self.WIDTH - 140, self.HEIGHT - 70, 120, 44)
         pygame.draw.rect(self.window, (140, 60, 60), close_rect)
-        close_label = self.hud_font.render("Cerrar", True, (255, 255, 255))
+        close_label = self.text.render(self.hud_font, "Cerrar", (255, 255, 255))
         self.window.blit(close_label, (close_rect.centerx - close_label.get_width() // 2, close_rect.centery - close_label.get_height() // 2))
         self.scores_close_rect = close_rect
 
+    def run_headless(self, max_ticks=None):
+        """Avanzar la simulación sin ventana ni límite de FPS.
+
+        Corre hasta Game Over / Victory o hasta `max_ticks`; devuelve un resumen.
+        """
+        ticks = 0
+        while not self.game_over and not self.victory:
+            if max_ticks is not None and ticks >= max_ticks:
+                break
+            self.update()
+            ticks += 1
+        return {
+            'ticks': ticks,
+            'level': self.level,
+            'score': self.score,
+            'kills': self.kills,
+            'game_time': self.game_time,
+            'health': self.player.health,
+            'game_over': self.game_over,
+            'damage': dict(self.damage_sources),
+        }
+
+    def check_unattended(self):
+        """Con una fuente desatendida (autopiloto): saltar el menú y reiniciar al terminar"""
+        if not self.input_source.unattended:
+            return
+        if self.in_menu:
+            self.in_menu = False
+        elif self.game_over or self.victory:
+            self.reset_game()
+
+    def step_simulation(self, frame_time, accumulator):
+        """Correr los ticks fijos que correspondan a `frame_time` segundos reales.
+
+        Devuelve el acumulador restante; limita la recuperación a
+        MAX_CATCHUP_TICKS por frame para no entrar en la espiral de la muerte.
+        """
+        tick_dt = 1.0 / self.FPS
+        accumulator += min(frame_time, MAX_FRAME_TIME)
+        ticks = 0
+        while accumulator >= tick_dt:
+            if ticks >= MAX_CATCHUP_TICKS:
+                # demasiado atraso: descartar el resto en lugar de acumularlo
+                accumulator = 0.0
+                break
+            self.update()
+            accumulator -= tick_dt
+            ticks += 1
+        self.render_alpha = accumulator / tick_dt
+        return accumulator
+
+    def run_frame(self, frame_time, accumulator):
+        """Un frame del bucle principal: ticks fijos, puntajes, dibujo y control de calidad"""
+        start = time.perf_counter()
+        if self.in_menu:
+            accumulator = 0.0
+        else:
+            accumulator = self.step_simulation(frame_time, accumulator)
+        self.poll_score_db()
+        # en calidad mínima se dibuja un frame de cada dos; la simulación no se saltea
+        rendered = self.pacer.should_render()
+        if rendered:
+            self.present()
+        self.pacer.record(time.perf_counter() - start, rendered)
+        self.end_profiler_frame(frame_time)
+        return accumulator
+
     def run(self):
         running = True
+        accumulator = 0.0
+        last = time.perf_counter()
         while running:
             running = self.handle_events()
             if not running:
                 break
-            if self.in_menu:
-                # dibujar menú especial
-                self.draw_menu()
-            else:
-                self.update()
-                self.draw()
-            pygame.display.flip()
+            self.check_unattended()
+            now = time.perf_counter()
+            frame_time = now - last
+            last = now
+            accumulator = self.run_frame(frame_time, accumulator)
             self.clock.tick(self.FPS)
+        # liberar las conexiones de la base de puntajes
+        if self.score_db:
+            self.score_db.close()
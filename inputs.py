@@ -0,0 +1,172 @@
+import pygame
+
+
+# Bits de entrada por tick (izquierda / derecha / disparo)
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_SHOOT = 4
+
+# Interfaz de una fuente de entrada (la que usa Game):
+#   read(game) -> máscara INPUT_* para el tick actual
+#   handle_event(event, game) -> True si consumió el evento de pygame
+#   unattended -> True si nadie la maneja (Game salta el menú y reinicia solo)
+
+
+class KeyboardInput:
+    """Entrada desde el teclado real (modo ventana).
+
+    Las flechas se leen con `pygame.key.get_pressed()`; el disparo llega como
+    evento KEYDOWN desde `Game.handle_events` y se entrega en el siguiente tick.
+    """
+    unattended = False
+
+    def __init__(self):
+        self._shoot_pending = False
+
+    def press_shoot(self):
+        self._shoot_pending = True
+
+    def handle_event(self, event, game):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE \
+                and not game.game_over and not game.victory:
+            self.press_shoot()
+            return True
+        return False
+
+    def read(self, game):
+        mask = 0
+        keys = pygame.key.get_pressed()
+        if keys[pygame.K_LEFT]:
+            mask |= INPUT_LEFT
+        if keys[pygame.K_RIGHT]:
+            mask |= INPUT_RIGHT
+        if self._shoot_pending:
+            mask |= INPUT_SHOOT
+            self._shoot_pending = False
+        return mask
+
+
+class ScriptedInput:
+    """Entrada inyectada para simulaciones sin ventana.
+
+    `script` puede ser una función `f(game) -> mask` o una secuencia de
+    máscaras (una por tick); al agotarse la secuencia se devuelve 0.
+    """
+    unattended = False
+    def __init__(self, script=None):
+        if script is None or callable(script):
+            self._fn = script
+            self._it = None
+        else:
+            self._fn = None
+            self._it = iter(script)
+
+    def press_shoot(self):
+        pass
+
+    def handle_event(self, event, game):
+        return False
+
+    def read(self, game):
+        if self._fn is not None:
+            return int(self._fn(game))
+        if self._it is not None:
+            return int(next(self._it, 0))
+        return 0
+
+
+class AutopilotInput:
+    """Piloto automático heurístico para pruebas de carga y soak.
+
+    Cada tick evalúa quedarse, ir a la izquierda o a la derecha proyectando
+    `horizon` ticks hacia adelante las balas enemigas y los enemigos que ya
+    están cerca de la fila de la nave, y elige la opción con menos choques.
+    Sin peligro se alinea con el enemigo más cercano que todavía se puede
+    derribar; dispara solo alineado para no vaciar el cargador (con el
+    cargador lleno dispara igual: la recarga no se pierde).
+    Funciona igual con ventana o headless; es desatendido.
+    """
+    unattended = True
+
+    def __init__(self, horizon=20, danger_band=160):
+        # ticks simulados hacia adelante y alto (px) de la franja peligrosa sobre la nave
+        self.horizon = horizon
+        self.danger_band = danger_band
+
+    def press_shoot(self):
+        pass
+
+    def handle_event(self, event, game):
+        return False
+
+    def threats(self, game):
+        """(x, y, ancho, alto, vx, vy) de lo que puede alcanzar a la nave pronto"""
+        p = game.player
+        top = p.y - self.danger_band
+        bottom = p.y + p.height
+        dy = 6 + game.level * 0.02
+        out = []
+        for r in game.enemy_bullets.rects():
+            if r.bottom >= top and r.y <= bottom:
+                out.append((r.x, r.y, r.w, r.h, 0.0, dy))
+        for e in game.enemy_wave.get_alive_enemies():
+            if e.y + e.height >= top and e.y <= bottom:
+                out.append((e.x, e.y, e.width, e.height, e.dx, e.speed))
+        return out
+
+    def danger(self, game, threats, move):
+        """Choques previstos si la nave se mueve `move` px por tick"""
+        p = game.player
+        hits = 0
+        for t in range(2, self.horizon + 1, 2):
+            px = min(max(p.x + move * t, 0), game.WIDTH - p.width)
+            for x, y, w, h, vx, vy in threats:
+                x += vx * t
+                y += vy * t
+                if x < px + p.width and px < x + w and y < p.y + p.height and p.y < y + h:
+                    # lo inminente pesa más
+                    hits += self.horizon + 1 - t
+        return hits
+
+    def target(self, game):
+        """Enemigo visible más cercano que aún está por encima de la franja peligrosa"""
+        p = game.player
+        px = p.x + p.width / 2
+        limit = p.y - self.danger_band / 2
+        best = None
+        best_d = None
+        for e in game.enemy_wave.get_alive_enemies():
+            if e.y + e.height < 0 or e.y + e.height > limit:
+                continue
+            dx = e.x + e.width / 2 - px
+            dy = p.y - e.y
+            d = dx * dx + dy * dy
+            if best_d is None or d < best_d:
+                best, best_d = e, d
+        return best
+
+    def read(self, game):
+        p = game.player
+        px = p.x + p.width / 2
+        target = self.target(game)
+        dx = 0.0
+        if target is not None:
+            dx = target.x + target.width / 2 - px
+        # preferencia sin peligro: acercarse al objetivo
+        wanted = 0
+        if abs(dx) > p.speed:
+            wanted = 1 if dx > 0 else -1
+        threats = self.threats(game)
+        best = wanted
+        if threats:
+            options = sorted((-1, 0, 1), key=lambda d: (d != wanted, d != 0))
+            best = min(options, key=lambda d: self.danger(game, threats, d * p.speed))
+        mask = 0
+        if best < 0:
+            mask |= INPUT_LEFT
+        elif best > 0:
+            mask |= INPUT_RIGHT
+        aligned = target is not None and abs(dx) < target.width / 2
+        if p.current_ammo > 0 and (aligned or p.current_ammo >= p.magazine_size):
+            mask |= INPUT_SHOOT
+        return mask
@@ -2,10 +2,17 @@ import pygame
 import sys
 from game import Game
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from inputs import ScriptedInput, AutopilotInput, INPUT_SHOOT
+from replay import Replay, simulate
 
 
-def main():
-    """Función principal para iniciar el juego"""
+def main(record_path=None, autopilot=False):
+    """Función principal para iniciar el juego
+
+    Args:
+        record_path (str|None): Si se indica, guarda el replay de la última partida.
+        autopilot (bool): Juega el piloto automático (modo kiosco, se reinicia solo).
+    """
     # Inicializar Pygame
     pygame.init()
     
@@ -23,16 +30,53 @@ def main():
         lives=3,
         window=screen,
         screen_width=SCREEN_WIDTH,
-        screen_height=SCREEN_HEIGHT
+        screen_height=SCREEN_HEIGHT,
+        record_replay=record_path is not None,
+        input_source=AutopilotInput() if autopilot else None,
     )
     
     # Ejecutar el juego
     game.run()
+    if record_path and game.replay is not None:
+        game.replay.save(record_path)
     
     # Salir de Pygame
     pygame.quit()
     sys.exit()
 
 
+def main_headless(max_ticks=None, autopilot=False):
+    """Simulación sin ventana (CI): dispara continuamente (o juega el autopiloto) y muestra el resumen"""
+    game = Game(
+        font=None,
+        FPS=FPS,
+        lives=3,
+        window=None,
+        screen_width=SCREEN_WIDTH,
+        screen_height=SCREEN_HEIGHT,
+        headless=True,
+        input_source=AutopilotInput() if autopilot else ScriptedInput(lambda g: INPUT_SHOOT),
+    )
+    print(game.run_headless(max_ticks=max_ticks))
+
+
+def main_replay(path):
+    """Re-simular un replay grabado (sin ventana, a toda velocidad)"""
+    replay = Replay.load(path)
+    print(simulate(replay, SCREEN_WIDTH, SCREEN_HEIGHT, FPS))
+
+
+def _arg_value(name, default=None):
+    if name in sys.argv:
+        return sys.argv[sys.argv.index(name) + 1]
+    return default
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--replay" in sys.argv:
+        main_replay(_arg_value("--replay"))
+    elif "--headless" in sys.argv:
+        ticks = _arg_value("--ticks")
+        main_headless(int(ticks) if ticks is not None else None, autopilot="--autopilot" in sys.argv)
+    else:
+        main(record_path=_arg_value("--record"), autopilot="--autopilot" in sys.argv)
\ No newline at end of file
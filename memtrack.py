@@ -0,0 +1,166 @@
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+
+def rss_mib():
+    """Memoria residente actual del proceso en MiB (máxima si no hay /proc)"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss: KiB en Linux, bytes en macOS
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+# Trazas propias (tracemalloc, importlib, este módulo) que no interesan en el top
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+)
+
+
+class MemoryTracker:
+    """Memoria y asignaciones por nivel.
+
+    En cada `level_up` toma un snapshot de tracemalloc y guarda un registro
+    del nivel terminado: memoria trazada (actual y pico), pico de RSS
+    muestreado durante el nivel, entidades (enemigos: el pico del nivel),
+    colecciones del GC y los sitios que más crecieron desde el snapshot
+    anterior. La memoria trazada se suma sobre el snapshot filtrado, sin las
+    trazas de este módulo ni de los archivos de `exclude` (p.ej. el driver
+    que mide). Si sube en cada uno de los últimos `window` niveles por más
+    de `growth_kib` en total, el registro se marca con `growth`.
+    """
+    def __init__(self, enabled=False, frames=1, top=10, sample_every=30, window=5, growth_kib=256):
+        self.enabled = False
+        self.frames = frames
+        self.top = top
+        self.sample_every = sample_every
+        self.window = window
+        self.growth_kib = growth_kib
+        self.records = []
+        self._snapshot = None
+        self._ticks = 0
+        self._rss_peak = 0.0
+        self._enemies_peak = 0
+        self._gc_base = None
+        self._filters = _SNAPSHOT_FILTERS
+        self._started_tracemalloc = False
+        if enabled:
+            self.start()
+
+    def start(self, exclude=()):
+        """Empezar a trazar; `exclude`: archivos cuyas asignaciones no cuentan"""
+        if self.enabled:
+            return
+        self._filters = _SNAPSHOT_FILTERS + tuple(tracemalloc.Filter(False, path) for path in exclude)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracemalloc = True
+        self.enabled = True
+        self._snapshot = self._take_snapshot()
+        self._begin_level()
+
+    def stop(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        self._snapshot = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _take_snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(self._filters)
+
+    def _begin_level(self):
+        self._ticks = 0
+        self._rss_peak = rss_mib()
+        self._enemies_peak = 0
+        self._gc_base = [s['collections'] for s in gc.get_stats()]
+        tracemalloc.reset_peak()
+
+    def tick(self, game):
+        """Llamar una vez por tick; muestrea el RSS cada `sample_every` ticks"""
+        self._ticks += 1
+        # en level_up la oleada ya está vacía: se guarda el pico del nivel
+        alive = game.enemy_wave.alive_count
+        if alive > self._enemies_peak:
+            self._enemies_peak = alive
+        if self._ticks % self.sample_every == 0:
+            rss = rss_mib()
+            if rss > self._rss_peak:
+                self._rss_peak = rss
+
+    def on_level_up(self, game, level):
+        """Cerrar el registro de `level` (el nivel recién superado)"""
+        peak = tracemalloc.get_traced_memory()[1]
+        snapshot = self._take_snapshot()
+        current = sum(trace.size for trace in snapshot.traces)
+        sites = []
+        for stat in snapshot.compare_to(self._snapshot, 'lineno')[:self.top]:
+            frame = stat.traceback[0]
+            sites.append({
+                'site': f"{frame.filename}:{frame.lineno}",
+                'size_diff_kib': round(stat.size_diff / 1024.0, 2),
+                'count_diff': stat.count_diff,
+                'size_kib': round(stat.size / 1024.0, 2),
+            })
+        self._snapshot = snapshot
+        gc_now = [s['collections'] for s in gc.get_stats()]
+        record = {
+            'level': level,
+            'ticks': self._ticks,
+            'traced_kib': round(current / 1024.0, 1),
+            'traced_peak_kib': round(peak / 1024.0, 1),
+            'rss_peak_mib': round(max(self._rss_peak, rss_mib()), 2),
+            'entities': {
+                'enemies': self._enemies_peak,
+                'wave_size': game.enemy_wave.get_last_wave_count(),
+                'enemy_pool': len(game.enemy_pool),
+                'player_bullets': len(game.player.bullets),
+                'enemy_bullets': len(game.enemy_bullets),
+            },
+            'gc_collections': [now - base for now, base in zip(gc_now, self._gc_base)],
+            'top_sites': sites,
+            'growth': False,
+        }
+        self.records.append(record)
+        record['growth'] = self.monotonic_growth()
+        if record['growth']:
+            print(f"Aviso: la memoria trazada creció en cada uno de los últimos {self.window} niveles "
+                  f"({record['traced_kib']} KiB en el nivel {level})")
+        self._begin_level()
+        return record
+
+    def on_reset(self):
+        """Partida nueva: el nivel en curso se descarta sin registro"""
+        self._begin_level()
+
+    def monotonic_growth(self):
+        """¿Subió la memoria trazada en cada uno de los últimos `window` niveles?"""
+        if len(self.records) <= self.window:
+            return False
+        values = [r['traced_kib'] for r in self.records[-(self.window + 1):]]
+        rising = all(b > a for a, b in zip(values, values[1:]))
+        return rising and values[-1] - values[0] > self.growth_kib
+
+    def report(self):
+        return {
+            'levels': self.records,
+            'growth_levels': [r['level'] for r in self.records if r['growth']],
+        }
+
+    def export_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+        return path
@@ -0,0 +1,40 @@
+import pygame
+
+
+class OverlayCache:
+    """Superficies de overlay reutilizables.
+
+    - `tint(size, rgba)`: capa translúcida de pantalla completa, creada una
+      vez por (tamaño, RGBA).
+    - `panel(key, size, build)`: panel estático pre-compuesto; `build(surface)`
+      lo dibuja y solo se vuelve a llamar si cambia `key` o el tamaño.
+    """
+    def __init__(self):
+        self._tints = {}
+        self._panels = {}
+
+    def tint(self, size, rgba):
+        key = (tuple(size), tuple(rgba))
+        surf = self._tints.get(key)
+        if surf is None:
+            surf = pygame.Surface(key[0], pygame.SRCALPHA)
+            surf.fill(key[1])
+            self._tints[key] = surf
+        return surf
+
+    def panel(self, key, size, build):
+        size = tuple(size)
+        entry = self._panels.get(key[0])
+        if entry is not None and entry[0] == (key, size):
+            return entry[1]
+        surf = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surf = surf.convert()
+        build(surf)
+        # una sola versión por tipo de panel (key[0]); la anterior se descarta
+        self._panels[key[0]] = ((key, size), surf)
+        return surf
+
+    def clear(self):
+        self._tints.clear()
+        self._panels.clear()
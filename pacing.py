@@ -0,0 +1,89 @@
+from collections import deque
+
+
+# Niveles de calidad, de mejor a peor. Cada uno incluye las rebajas de los anteriores.
+QUALITY_NAMES = ('alta', 'media', 'baja', 'mínima')
+# media: HUD sin antialias y polifonía de explosiones limitada
+# baja: además, fondo liso (sin campo de estrellas)
+# mínima: además, se dibuja un frame de cada dos (la simulación sigue a tick completo)
+MAX_EXPLOSIONS = (None, 2, 1, 1)
+
+
+class FramePacer:
+    """Control del presupuesto por frame con calidad adaptativa.
+
+    `record` recibe el costo de cada frame (simulación + dibujo, sin la
+    espera de `clock.tick`). Si el promedio de la ventana reciente supera
+    `degrade_at` del presupuesto durante `down_after` frames se baja un nivel
+    de calidad; si queda por debajo de `restore_at` durante `up_after` frames
+    se sube uno. La histéresis evita oscilar entre niveles.
+    """
+    def __init__(self, fps, enabled=True, window=30, degrade_at=0.9, restore_at=0.6,
+                 down_after=15, up_after=120):
+        self.enabled = enabled
+        self.budget = 1.0 / fps
+        self.degrade_at = degrade_at
+        self.restore_at = restore_at
+        self.down_after = down_after
+        self.up_after = up_after
+        self.costs = deque(maxlen=window)
+        self.tier = 0
+        self._over = 0
+        self._under = 0
+        self._frame = 0
+        self.changes = 0
+
+    @property
+    def name(self):
+        return QUALITY_NAMES[self.tier]
+
+    @property
+    def antialias(self):
+        return self.tier < 1
+
+    @property
+    def max_explosions(self):
+        return MAX_EXPLOSIONS[self.tier]
+
+    @property
+    def skip_background(self):
+        return self.tier >= 2
+
+    def average(self):
+        return sum(self.costs) / len(self.costs) if self.costs else 0.0
+
+    def should_render(self):
+        """¿Dibujar este frame? En calidad mínima se dibuja uno de cada dos"""
+        self._frame += 1
+        return self.tier < 3 or self._frame % 2 == 0
+
+    def record(self, cost, rendered=True):
+        # los frames sin dibujar (calidad mínima) no cuentan: subestimarían el costo real
+        if not self.enabled or not rendered:
+            return
+        self.costs.append(cost)
+        avg = self.average()
+        if avg > self.budget * self.degrade_at:
+            self._over += 1
+            self._under = 0
+            if self._over >= self.down_after and self.tier < len(QUALITY_NAMES) - 1:
+                self._set_tier(self.tier + 1)
+        elif avg < self.budget * self.restore_at:
+            self._under += 1
+            self._over = 0
+            if self._under >= self.up_after and self.tier > 0:
+                self._set_tier(self.tier - 1)
+        else:
+            self._over = 0
+            self._under = 0
+
+    def _set_tier(self, tier):
+        self.tier = tier
+        self.changes += 1
+        self._over = 0
+        self._under = 0
+        # medir el nuevo nivel desde cero
+        self.costs.clear()
+
+    def reset(self):
+        self._set_tier(0)
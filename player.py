@@ -1,7 +1,8 @@
 import pygame
 import os
 from spaceship import SpaceShip
-from constants import PLAYER_MAX_BULLETS, PLAYER_SHOOT_COOLDOWN, PLAYER_RELOAD_TIME
+from asset_cache import assets
+from constants import PLAYER_MAX_BULLETS, PLAYER_SHOOT_COOLDOWN, PLAYER_RELOAD_TIME, PLAYER_BULLET_SPEED
 
 
 class Player(SpaceShip):
@@ -34,21 +35,20 @@ class Player(SpaceShip):
         self.shoot_cooldown_max = PLAYER_SHOOT_COOLDOWN  # Frames entre disparos
 
         # Velocidad de las balas
-        self.bullet_speed = 12
+        self.bullet_speed = PLAYER_BULLET_SPEED
     
     def set_image(self, image_path):
         """Cargar la imagen del jugador"""
         try:
-            self.image = pygame.image.load(image_path).convert_alpha()
-            self.image = pygame.transform.scale(self.image, (self.width, self.height))
-            self.mask = pygame.mask.from_surface(self.image)
+            self.image = assets.load_image(image_path, (self.width, self.height))
+            self.mask = assets.load_mask(image_path, (self.width, self.height))
         except pygame.error as e:
             print(f"Error al cargar imagen del jugador: {e}")
     
     def set_bullet_image(self, bullet_path):
         """Cargar la imagen de las balas"""
         try:
-            self.bullet_img = pygame.image.load(bullet_path).convert_alpha()
+            self.bullet_img = assets.load_image(bullet_path)
         except pygame.error as e:
             print(f"Error al cargar imagen de bala: {e}")
     
@@ -68,12 +68,8 @@ class Player(SpaceShip):
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
         
-        # Actualizar posición de balas
-        for bullet in self.bullets[:]:
-            bullet['y'] -= self.bullet_speed
-            # Eliminar balas fuera de pantalla
-            if bullet['y'] < 0:
-                self.bullets.remove(bullet)
+        # Actualizar posición de balas y eliminar las que salen por arriba
+        self.bullets.update(min_y=0)
         
         # Recarga gradual: si no hay munición completa, recargar con el contador
         if self.current_ammo < self.magazine_size:
@@ -88,14 +84,13 @@ class Player(SpaceShip):
             # Tamaño de bala proporcional al ancho de la nave
             bw = max(4, int(self.width * 0.12))
             bh = max(8, int(self.height * 0.5))
-            bullet = {
-                'x': self.x + (self.width - bw) / 2,  # Centro de la nave
-                'y': self.y - bh,
-                'width': bw,
-                'height': bh,
-                'active': True,
-            }
-            self.bullets.append(bullet)
+            self.bullets.spawn(
+                self.x + (self.width - bw) / 2,  # Centro de la nave
+                self.y - bh,
+                bw,
+                bh,
+                -self.bullet_speed,
+            )
             self.shoot_cooldown = self.shoot_cooldown_max
             # consumir munición del cargador
             self.current_ammo = max(0, self.current_ammo - 1)
@@ -110,24 +105,24 @@ class Player(SpaceShip):
         # Aumentar el cooldown para hacer el juego más difícil (máx 60)
         self.shoot_cooldown_max = min(60, self.shoot_cooldown_max + 1)
     
-    def draw_bullets(self, window):
-        """Dibujar las balas del jugador"""
-        for bullet in self.bullets:
+    def draw_bullets(self, window, alpha=1.0):
+        """Dibujar las balas del jugador; devuelve los rects afectados"""
+        drawn = []
+        for x, y, w, h, _ in self.bullets.rows(alpha):
             if self.bullet_img:
-                # Escalar la imagen de la bala al tamaño de la bala actual
+                # Imagen de la bala al tamaño actual (variante cacheada)
                 try:
-                    img = pygame.transform.scale(self.bullet_img, (int(bullet['width']), int(bullet['height'])))
-                    window.blit(img, (bullet['x'], bullet['y']))
+                    img = assets.variant(self.bullet_img, (int(w), int(h)))
+                    drawn.append(window.blit(img, (x, y)))
                 except Exception:
-                    window.blit(self.bullet_img, (bullet['x'], bullet['y']))
+                    drawn.append(window.blit(self.bullet_img, (x, y)))
             else:
                 # Dibujar un rectángulo si no hay imagen
-                pygame.draw.rect(window, (255, 255, 0), 
-                               (bullet['x'], bullet['y'], bullet['width'], bullet['height']))
+                drawn.append(pygame.draw.rect(window, (255, 255, 0), (x, y, w, h)))
+        return drawn
     
     def get_bullet_rect(self, bullet_index):
         """Obtener el rectángulo de una bala específica"""
         if bullet_index < len(self.bullets):
-            bullet = self.bullets[bullet_index]
-            return pygame.Rect(bullet['x'], bullet['y'], bullet['width'], bullet['height'])
+            return self.bullets.rect(bullet_index)
         return None
@@ -0,0 +1,102 @@
+import csv
+import time
+from collections import deque
+
+import pygame
+
+from pacing import QUALITY_NAMES
+
+
+UPDATE_PHASES = ('input', 'player', 'enemy_wave', 'enemy_bullets', 'enemy_shoot', 'collisions', 'conditions')
+DRAW_PHASES = ('background', 'sprites', 'hud', 'overlays')
+PHASES = UPDATE_PHASES + DRAW_PHASES
+COUNTS = ('enemies', 'player_bullets', 'enemy_bullets', 'narrowphase', 'quality')
+
+
+class FrameProfiler:
+    """Tiempos por fase de `Game.update` / `Game.draw` y overlay de depuración.
+
+    Deshabilitado no mide nada: `Game` solo consulta `enabled` antes de cada
+    marca. Habilitado, acumula el tiempo entre marcas consecutivas en la fase
+    indicada y guarda una fila por frame (exportable a CSV).
+    """
+    def __init__(self, history=120, max_records=36000):
+        self.enabled = False
+        self._t = 0.0
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.frame_times = deque(maxlen=history)
+        self.history = {phase: deque(maxlen=history) for phase in PHASES}
+        self.counts = dict.fromkeys(COUNTS, 0)
+        self.records = deque(maxlen=max_records)
+        self.frame = 0
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._t = time.perf_counter()
+        self.current = dict.fromkeys(PHASES, 0.0)
+
+    def begin(self):
+        self._t = time.perf_counter()
+
+    def mark(self, phase):
+        """Sumar a `phase` el tiempo transcurrido desde la marca anterior"""
+        now = time.perf_counter()
+        self.current[phase] += now - self._t
+        self._t = now
+
+    def end_frame(self, frame_time, counts):
+        self.frame += 1
+        self.frame_times.append(frame_time * 1000.0)
+        row = [self.frame, round(frame_time * 1000.0, 4)]
+        for phase in PHASES:
+            ms = self.current[phase] * 1000.0
+            self.history[phase].append(ms)
+            row.append(round(ms, 4))
+            self.current[phase] = 0.0
+        self.counts = counts
+        row.extend(counts[c] for c in COUNTS)
+        self.records.append(row)
+
+    def average(self, phase):
+        values = self.history[phase]
+        return sum(values) / len(values) if values else 0.0
+
+    def frame_stats(self):
+        """(promedio, máximo) del tiempo de frame en la ventana reciente, en ms"""
+        if not self.frame_times:
+            return 0.0, 0.0
+        return sum(self.frame_times) / len(self.frame_times), max(self.frame_times)
+
+    def export_csv(self, path):
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame', 'frame_ms'] + [f'{p}_ms' for p in PHASES] + list(COUNTS))
+            writer.writerows(self.records)
+        return path
+
+    def lines(self):
+        avg, worst = self.frame_stats()
+        out = [f"Frame: {avg:5.2f} ms (max {worst:5.2f})"]
+        out.append("update: " + "  ".join(f"{p} {self.average(p):.2f}" for p in UPDATE_PHASES[:4]))
+        out.append("        " + "  ".join(f"{p} {self.average(p):.2f}" for p in UPDATE_PHASES[4:]))
+        out.append("draw:   " + "  ".join(f"{p} {self.average(p):.2f}" for p in DRAW_PHASES))
+        out.append("enemigos {enemies}  balas jugador {player_bullets}  balas enemigas {enemy_bullets}".format(**self.counts))
+        out.append("pares a máscara (último tick): {narrowphase}".format(**self.counts))
+        out.append(f"calidad: {QUALITY_NAMES[self.counts['quality']]} (nivel {self.counts['quality']})")
+        return out
+
+    def draw(self, window, font, pos=(10, 0)):
+        """Dibujar el overlay; devuelve el rect ocupado"""
+        lines = [font.render(text, True, (0, 255, 120)) for text in self.lines()]
+        w = max(l.get_width() for l in lines) + 12
+        h = sum(l.get_height() + 2 for l in lines) + 10
+        x = pos[0]
+        y = pos[1] if pos[1] else window.get_height() - h - 10
+        panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        window.blit(panel, (x, y))
+        ty = y + 5
+        for l in lines:
+            window.blit(l, (x + 6, ty))
+            ty += l.get_height() + 2
+        return pygame.Rect(x, y, w, h)
@@ -0,0 +1,63 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    """Renderizado por rectángulos sucios.
+
+    En pantallas de juego solo se restauran con el fondo las áreas dibujadas
+    en el frame anterior, se dibujan las del frame actual y ambas listas se
+    envían a `pygame.display.update(rects)`. Las pantallas estáticas (menú,
+    Game Over, intro de nivel) se redibujan y envían únicamente cuando cambia
+    su clave de estado.
+    """
+    def __init__(self, window, background):
+        self.window = window
+        self.background = background
+        self._prev = []
+        self._cur = []
+        self._static_key = None
+        # tras una pantalla estática (o al inicio) hace falta un frame completo
+        self._full = True
+
+    def invalidate(self):
+        self._static_key = None
+        self._full = True
+
+    def present_static(self, key, draw_fn):
+        """Dibujar `draw_fn` y enviar la pantalla solo si `key` cambió"""
+        if key == self._static_key:
+            return False
+        draw_fn()
+        pygame.display.flip()
+        self._static_key = key
+        self._prev = []
+        self._full = True
+        return True
+
+    def begin_frame(self):
+        """Borrar con el fondo lo dibujado en el frame anterior"""
+        self._static_key = None
+        self._cur = []
+        if self._full or not self.background.is_static:
+            self.background.draw(self.window)
+            return
+        for r in self._prev:
+            self.background.draw_area(self.window, r)
+
+    def mark(self, rect):
+        if rect:
+            self._cur.append(rect)
+
+    def mark_all(self, rects):
+        for r in rects:
+            if r:
+                self._cur.append(r)
+
+    def end_frame(self):
+        if self._full or not self.background.is_static:
+            pygame.display.flip()
+            self._full = False
+        else:
+            pygame.display.update(self._prev + self._cur)
+        self._prev = self._cur
+        self._cur = []
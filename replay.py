@@ -0,0 +1,122 @@
+import struct
+
+from inputs import ScriptedInput
+
+
+# Formato binario: cabecera + 1 byte por tick con la máscara de entrada
+# (INPUT_LEFT / INPUT_RIGHT / INPUT_SHOOT de inputs.py)
+REPLAY_MAGIC = b'SIRP'
+REPLAY_VERSION = 2
+_PREFIX = struct.Struct('<4sB')  # magic, versión
+_HEADERS = {
+    1: struct.Struct('<4sBQBI'),  # magic, versión, semilla, vidas, ticks
+    2: struct.Struct('<4sBQBIBB'),  # ... + flags de simulación, modo de disparo
+}
+_HEADER = _HEADERS[REPLAY_VERSION]
+
+# Opciones que cambian la simulación: se graban para re-simular igual
+_FLAG_PIXEL_PERFECT = 1
+_FLAG_SWARM = 2
+_FLAG_FIRING_LEGACY_RATE = 4
+_FIRING_MODES = ('sampled', 'batched')
+# Lo que valía al grabar los replays de la versión 1
+DEFAULT_SETTINGS = {
+    'swarm': False,
+    'pixel_perfect': False,
+    'firing_mode': 'sampled',
+    'firing_legacy_rate': True,
+}
+
+
+class Replay:
+    """Grabación de una partida: semilla del RNG y entradas por tick.
+
+    Re-simular con la misma semilla, las mismas entradas y las mismas
+    opciones de simulación (`settings`, ver `Game.replay_settings`)
+    reproduce la partida tick a tick.
+    """
+    def __init__(self, seed, lives, inputs=None, settings=None):
+        self.seed = seed
+        self.lives = lives
+        self.inputs = bytearray(inputs or b'')
+        self.settings = dict(DEFAULT_SETTINGS, **(settings or {}))
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def record(self, mask):
+        self.inputs.append(mask & 0xFF)
+
+    def to_bytes(self):
+        settings = self.settings
+        if settings['firing_mode'] not in _FIRING_MODES:
+            raise ValueError(f"Modo de disparo desconocido: {settings['firing_mode']}")
+        flags = ((_FLAG_PIXEL_PERFECT if settings['pixel_perfect'] else 0)
+                 | (_FLAG_SWARM if settings['swarm'] else 0)
+                 | (_FLAG_FIRING_LEGACY_RATE if settings['firing_legacy_rate'] else 0))
+        header = _HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.lives, len(self.inputs),
+                              flags, _FIRING_MODES.index(settings['firing_mode']))
+        return header + bytes(self.inputs)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < _PREFIX.size:
+            raise ValueError("Replay inválido: archivo incompleto")
+        magic, version = _PREFIX.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("Replay inválido: firma desconocida")
+        header = _HEADERS.get(version)
+        if header is None:
+            raise ValueError(f"Versión de replay no soportada: {version}")
+        if len(data) < header.size:
+            raise ValueError("Replay inválido: archivo incompleto")
+        fields = header.unpack_from(data)
+        seed, lives, ticks = fields[2:5]
+        settings = None
+        if version >= 2:
+            flags, mode = fields[5:7]
+            if mode >= len(_FIRING_MODES):
+                raise ValueError(f"Replay inválido: modo de disparo {mode}")
+            settings = {
+                'swarm': bool(flags & _FLAG_SWARM),
+                'pixel_perfect': bool(flags & _FLAG_PIXEL_PERFECT),
+                'firing_mode': _FIRING_MODES[mode],
+                'firing_legacy_rate': bool(flags & _FLAG_FIRING_LEGACY_RATE),
+            }
+        inputs = data[header.size:header.size + ticks]
+        if len(inputs) != ticks:
+            raise ValueError("Replay inválido: faltan ticks")
+        return cls(seed, lives, inputs, settings)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    def input_source(self):
+        """Fuente de entrada que reproduce las máscaras grabadas"""
+        return ScriptedInput(self.inputs)
+
+
+def simulate(replay, screen_width, screen_height, fps):
+    """Re-simular un replay en modo headless a toda velocidad; devuelve el resumen"""
+    from game import Game
+    game = Game(
+        font=None,
+        FPS=fps,
+        lives=replay.lives,
+        window=None,
+        screen_width=screen_width,
+        screen_height=screen_height,
+        headless=True,
+        input_source=replay.input_source(),
+        seed=replay.seed,
+        swarm=replay.settings['swarm'],
+        pixel_perfect=replay.settings['pixel_perfect'],
+    )
+    game.apply_replay_settings(replay.settings)
+    return game.run_headless(max_ticks=len(replay))
@@ -1,3 +1,4 @@
+import queue
 import sqlite3
 import threading
 import time
@@ -7,66 +8,251 @@ class Puntajes:
     """Manejador simple de puntajes usando SQLite local.
 
     Campos: name, kills, play_time, level, score, ts
+
+    Las escrituras desde el juego van por `submit_score`: un hilo escritor las
+    toma de una cola acotada y las inserta por lotes en una sola transacción;
+    `poll_completed` entrega los resultados (y ejecuta los callbacks) en el
+    hilo que la llama.
     """
-    def __init__(self, db_path='scores.db'):
+    def __init__(self, db_path='scores.db', queue_size=64, batch_size=32):
         self.db_path = db_path
         self._lock = threading.Lock()
+        # Conexiones reutilizables: una por hilo (protegidas por _lock al crearlas/cerrarlas)
+        self._local = threading.local()
+        self._conns = []
+        self._closed = False
+        # Caché de consultas del leaderboard; se invalida en cada commit de puntajes.
+        # `_cache_gen` sube con cada invalidación (bajo _lock): una lectura que
+        # empezó antes de un commit no guarda su resultado viejo.
+        self._cache = {}
+        self._cache_gen = 0
+        # Escritor en segundo plano (se inicia con el primer submit_score)
+        self.batch_size = batch_size
+        self._pending = queue.Queue(maxsize=queue_size)
+        self._done = queue.Queue()
+        self._callbacks = {}
+        self._next_ticket = 0
+        self._writer = None
         self._ensure_table()
 
     def _get_conn(self):
-        return sqlite3.connect(self.db_path)
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Puntajes cerrado")
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # WAL: lecturas sin bloquear escrituras; NORMAL evita fsync en cada commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=2000")
+            self._conns.append(conn)
+        self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Vaciar la cola de escrituras y cerrar todas las conexiones"""
+        writer = self._writer
+        if writer is not None:
+            self._pending.put(None)
+            writer.join()
+            self._writer = None
+        with self._lock:
+            self._closed = True
+            for conn in self._conns:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._conns = []
+        self._local = threading.local()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def _ensure_table(self):
+        conn = self._get_conn()
         with self._lock:
-            conn = self._get_conn()
-            try:
-                cur = conn.cursor()
-                cur.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS scores (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        name TEXT,
-                        kills INTEGER,
-                        play_time REAL,
-                        level INTEGER,
-                        score INTEGER,
-                        ts REAL
-                    )
-                    """
+            cur = conn.cursor()
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS scores (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT,
+                    kills INTEGER,
+                    play_time REAL,
+                    level INTEGER,
+                    score INTEGER,
+                    ts REAL
                 )
-                conn.commit()
-            finally:
-                conn.close()
+                """
+            )
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC, ts DESC)")
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_scores_ts ON scores (ts DESC)")
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_scores_name_score ON scores (name, score DESC)")
+            conn.commit()
 
     def add_score(self, name, kills, play_time, level, score):
         ts = time.time()
+        conn = self._get_conn()
         with self._lock:
-            conn = self._get_conn()
-            try:
-                cur = conn.cursor()
-                cur.execute(
-                    "INSERT INTO scores (name, kills, play_time, level, score, ts) VALUES (?, ?, ?, ?, ?, ?)",
-                    (name, int(kills), float(play_time), int(level), int(score), float(ts)),
-                )
-                conn.commit()
-            finally:
-                conn.close()
+            cur = conn.cursor()
+            cur.execute(
+                "INSERT INTO scores (name, kills, play_time, level, score, ts) VALUES (?, ?, ?, ?, ?, ?)",
+                (name, int(kills), float(play_time), int(level), int(score), float(ts)),
+            )
+            conn.commit()
+            self._invalidate_cache()
 
-    def get_last_scores(self, limit=10):
-        conn = self._get_conn()
+    def submit_score(self, name, kills, play_time, level, score, callback=None):
+        """Encolar un puntaje para guardarlo sin bloquear el frame.
+
+        Devuelve un ticket; `callback(ticket, ok)` se ejecuta desde
+        `poll_completed` cuando el commit terminó. Lanza `queue.Full` si la
+        cola está llena.
+        """
+        row = (name, int(kills), float(play_time), int(level), int(score), float(time.time()))
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Puntajes cerrado")
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            if callback is not None:
+                self._callbacks[ticket] = callback
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, name="puntajes-writer", daemon=True)
+                self._writer.start()
         try:
-            cur = conn.cursor()
-            cur.execute("SELECT name, kills, play_time, level, score, ts FROM scores ORDER BY ts DESC LIMIT ?", (limit,))
-            rows = cur.fetchall()
-            return rows
-        finally:
-            conn.close()
+            self._pending.put_nowait((ticket, row))
+        except queue.Full:
+            with self._lock:
+                self._callbacks.pop(ticket, None)
+            raise
+        return ticket
 
-    def get_all_scores(self):
-        conn = self._get_conn()
+    def poll_completed(self):
+        """Lista de (ticket, ok) terminados desde la última llamada"""
+        done = []
+        while True:
+            try:
+                ticket, ok = self._done.get_nowait()
+            except queue.Empty:
+                break
+            done.append((ticket, ok))
+            with self._lock:
+                callback = self._callbacks.pop(ticket, None)
+            if callback is not None:
+                callback(ticket, ok)
+        return done
+
+    def _writer_loop(self):
+        stop = False
+        while not stop:
+            item = self._pending.get()
+            if item is None:
+                break
+            batch = [item]
+            # juntar lo que ya esté en cola (hasta batch_size) en una transacción
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._pending.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            ok = True
+            try:
+                conn = self._get_conn()
+                with self._lock:
+                    try:
+                        conn.executemany(
+                            "INSERT INTO scores (name, kills, play_time, level, score, ts) VALUES (?, ?, ?, ?, ?, ?)",
+                            [row for _, row in batch],
+                        )
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+                    self._invalidate_cache()
+            except Exception as e:
+                print("Error guardando puntajes:", e)
+                ok = False
+            for ticket, _ in batch:
+                self._done.put((ticket, ok))
+
+    def _query(self, query, params=()):
+        cur = self._get_conn().cursor()
         try:
-            cur = conn.cursor()
-            cur.execute("SELECT name, kills, play_time, level, score, ts FROM scores ORDER BY ts DESC")
+            cur.execute(query, params)
             return cur.fetchall()
         finally:
-            conn.close()
+            cur.close()
+
+    def get_last_scores(self, limit=10):
+        return self._query("SELECT name, kills, play_time, level, score, ts FROM scores ORDER BY ts DESC LIMIT ?", (limit,))
+
+    def get_all_scores(self):
+        return self._query("SELECT name, kills, play_time, level, score, ts FROM scores ORDER BY ts DESC")
+
+    def _invalidate_cache(self):
+        # llamar con _lock tomado
+        self._cache.clear()
+        self._cache_gen += 1
+
+    def _cached(self, key, query, params=()):
+        rows = self._cache.get(key)
+        if rows is None:
+            gen = self._cache_gen
+            rows = self._query(query, params)
+            with self._lock:
+                # si hubo un commit durante la consulta, el resultado puede ser viejo
+                if gen == self._cache_gen:
+                    self._cache[key] = rows
+        return rows
+
+    def get_top_scores(self, limit=10):
+        """Mejores `limit` puntajes (mayor score primero; empates, el más reciente)"""
+        return self._cached(
+            ('top', limit),
+            "SELECT name, kills, play_time, level, score, ts FROM scores ORDER BY score DESC, ts DESC LIMIT ?",
+            (limit,),
+        )
+
+    def get_best_score(self):
+        """Fila con el mayor puntaje, o None si no hay registros"""
+        rows = self.get_top_scores(1)
+        return rows[0] if rows else None
+
+    def get_best_per_player(self, limit=10):
+        """Mejor puntaje de cada jugador, ordenado por score"""
+        return self._cached(
+            ('best_per_player', limit),
+            """
+            SELECT s.name, s.kills, s.play_time, s.level, s.score, s.ts
+            FROM scores s
+            WHERE s.id = (
+                SELECT id FROM scores
+                WHERE name = s.name
+                ORDER BY score DESC, ts DESC
+                LIMIT 1
+            )
+            ORDER BY s.score DESC, s.ts DESC
+            LIMIT ?
+            """,
+            (limit,),
+        )
+
+    def get_rank(self, score):
+        """Posición (1 = mejor) que tendría `score` en el leaderboard"""
+        rows = self._cached(
+            ('rank', int(score)),
+            "SELECT COUNT(*) FROM scores WHERE score > ?",
+            (int(score),),
+        )
+        return rows[0][0] + 1
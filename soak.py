@@ -0,0 +1,154 @@
+"""Prueba de soak: el autopiloto juega sin parar y se registran tiempos y memoria.
+
+Con ventana (o driver `dummy`) mide el costo real de cada frame; con
+`--headless` solo la simulación. Al perder, la partida se reinicia sola (en
+`--start-level` si se indicó). Cada `--report-every` segundos se imprime una
+línea JSON con percentiles del tiempo de frame, FPS, nivel y RSS:
+
+    python soak.py --minutes 480 --start-level 50 --out soak.json
+    python soak.py --headless --minutes 10
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+from bench import summarize
+from memtrack import rss_mib
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_FONT_SIZE
+from game import Game
+from inputs import AutopilotInput
+
+
+def jump_to_level(game, level):
+    """Generar las oleadas sucesivas hasta `level` (mismo tamaño que jugándolas)"""
+    for lvl in range(game.level + 1, level + 1):
+        game.level = lvl
+        game.create_wave()
+
+
+def build_game(headless, start_level, seed, memtrack=False):
+    window = font = None
+    if not headless:
+        pygame.init()
+        window = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Space Invaders (soak)")
+        font = pygame.font.Font(None, GAME_FONT_SIZE)
+    game = Game(font=font, FPS=FPS, lives=3, window=window,
+                screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT,
+                headless=headless, input_source=AutopilotInput(), seed=seed)
+    jump_to_level(game, start_level)
+    if memtrack:
+        # las muestras de tiempo de este driver no son memoria del juego
+        game.memory.start(exclude=(__file__,))
+    return game
+
+
+def run(minutes, headless, start_level, seed, report_every, uncapped, emit, memtrack=None):
+    game = build_game(headless, start_level, seed, memtrack is not None)
+    perf = time.perf_counter
+    start = last_report = last = perf()
+    deadline = start + minutes * 60.0
+    accumulator = 0.0
+    samples = []
+    windows = []
+    frames = restarts = 0
+    rss_start = rss_mib()
+    while True:
+        t0 = perf()
+        if t0 >= deadline:
+            break
+        if headless:
+            game.update()
+        else:
+            if not game.handle_events():
+                break
+            accumulator = game.run_frame(t0 - last, accumulator)
+        ended = game.game_over or game.victory
+        game.check_unattended()
+        if ended:
+            restarts += 1
+            jump_to_level(game, start_level)
+        t1 = perf()
+        samples.append((t1 - t0) * 1000.0)
+        frames += 1
+        last = t0
+        if not headless and not uncapped:
+            game.clock.tick(FPS)
+        if t1 - last_report >= report_every:
+            row = summarize(samples)
+            row.update({
+                'elapsed_s': round(t1 - start, 1),
+                'fps': round(len(samples) / (t1 - last_report), 1),
+                'max_ms': round(max(samples), 3),
+                'level': game.level,
+                'enemies': game.enemy_wave.alive_count,
+                'restarts': restarts,
+                'rss_mib': round(rss_mib(), 2),
+                'quality': game.pacer.name,
+            })
+            windows.append(row)
+            emit(row)
+            samples = []
+            last_report = t1
+    if memtrack:
+        game.memory.export_json(memtrack)
+        game.memory.stop()
+    if game.score_db:
+        game.score_db.close()
+    if not headless:
+        pygame.quit()
+    rss_end = rss_mib()
+    return {
+        'meta': {
+            'minutes': minutes,
+            'headless': headless,
+            'start_level': start_level,
+            'seed': seed,
+            'uncapped': uncapped,
+        },
+        'frames': frames,
+        'restarts': restarts,
+        'rss_start_mib': round(rss_start, 2),
+        'rss_end_mib': round(rss_end, 2),
+        'rss_growth_mib': round(rss_end - rss_start, 2),
+        'windows': windows,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Soak con autopiloto: tiempos de frame y RSS")
+    parser.add_argument('--minutes', type=float, default=60.0)
+    parser.add_argument('--headless', action='store_true', help="solo simulación, sin ventana")
+    parser.add_argument('--start-level', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--report-every', type=float, default=60.0, help="segundos entre líneas de reporte")
+    parser.add_argument('--uncapped', action='store_true', help="sin límite de FPS (con ventana)")
+    parser.add_argument('--out', help="JSON final con todas las ventanas")
+    parser.add_argument('--memtrack', metavar='PATH',
+                        help="snapshots de tracemalloc por nivel (memtrack.py), guardados en PATH")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout
+
+    def emit(row):
+        print(json.dumps(row), file=out, flush=True)
+
+    # los avisos del juego (assets/sonido) no deben mezclarse con las líneas JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run(args.minutes, args.headless, args.start_level, args.seed, args.report_every,
+                     args.uncapped, emit, args.memtrack)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,6 @@
 import pygame
+from asset_cache import assets
+from bullets import BulletPool
 
 
 class SpaceShip:
@@ -6,9 +8,16 @@ class SpaceShip:
 
     Provee: posición, vida, imagen, balas simples y utilidades de dibujado/colisión.
     """
+    __slots__ = ('x', 'y', 'prev_x', 'prev_y', 'health', 'max_health', 'width', 'height',
+                 'image', 'bullet_img', '_bullets', 'shoot_cooldown', 'shoot_cooldown_max',
+                 'mask', '__weakref__')
+
     def __init__(self, x, y, health, width, height):
         self.x = x
         self.y = y
+        # Posición del tick anterior (para interpolar al dibujar)
+        self.prev_x = x
+        self.prev_y = y
         self.health = health
         self.max_health = health
         self.width = width
@@ -17,8 +26,9 @@ class SpaceShip:
         self.image = None
         self.bullet_img = None
 
-        # Lista de balas: dicts con keys x,y,w,h,dy,img
-        self.bullets = []
+        # Balas propias en un BulletPool (x, y, w, h, dy, sprite); se crea con el
+        # primer uso: los enemigos disparan al pool compartido del juego
+        self._bullets = None
 
         # Cooldown para disparo (frames)
         self.shoot_cooldown = 0
@@ -27,22 +37,39 @@ class SpaceShip:
         # Máscara para colisiones pixel-perfect
         self.mask = None
 
+    @property
+    def bullets(self):
+        if self._bullets is None:
+            self._bullets = BulletPool()
+        return self._bullets
+
     def set_image(self, image_path_or_surface):
         if isinstance(image_path_or_surface, str):
-            self.image = pygame.image.load(image_path_or_surface).convert_alpha()
+            self.image = assets.load_image(image_path_or_surface)
+            self.mask = assets.load_mask(image_path_or_surface)
         else:
             self.image = image_path_or_surface
-        self.mask = pygame.mask.from_surface(self.image)
+            self.mask = pygame.mask.from_surface(self.image)
 
     def set_bullet_image(self, image_path_or_surface):
         if isinstance(image_path_or_surface, str):
-            self.bullet_img = pygame.image.load(image_path_or_surface).convert_alpha()
+            self.bullet_img = assets.load_image(image_path_or_surface)
         else:
             self.bullet_img = image_path_or_surface
 
-    def draw(self, window):
+    def save_position(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def draw(self, window, alpha=1.0):
+        """Dibujar interpolando entre el tick anterior (alpha=0) y el actual (alpha=1)"""
         if self.image:
-            window.blit(self.image, (self.x, self.y))
+            if alpha >= 1.0:
+                return window.blit(self.image, (self.x, self.y))
+            x = self.prev_x + (self.x - self.prev_x) * alpha
+            y = self.prev_y + (self.y - self.prev_y) * alpha
+            return window.blit(self.image, (x, y))
+        return None
 
     def get_rect(self):
         return pygame.Rect(int(self.x), int(self.y), int(self.width), int(self.height))
@@ -58,19 +85,11 @@ class SpaceShip:
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
 
-    def shoot_bullet_dict(self, x, y, width, height, dy):
-        return {'x': x, 'y': y, 'width': width, 'height': height, 'dy': dy, 'img': self.bullet_img}
+    def spawn_bullet(self, pool, x, y, width, height, dy):
+        return pool.spawn(x, y, width, height, dy, self.bullet_img)
 
-    def draw_bullets(self, window):
-        for b in self.bullets:
-            if b.get('img'):
-                img = b['img']
-                window.blit(img, (b['x'], b['y']))
-            else:
-                pygame.draw.rect(window, (255, 255, 0), (b['x'], b['y'], b['width'], b['height']))
+    def draw_bullets(self, window, alpha=1.0):
+        return self.bullets.draw(window, (255, 255, 0), alpha)
 
     def update_bullets(self, screen_height):
-        for b in self.bullets[:]:
-            b['y'] += b['dy']
-            if b['y'] < -50 or b['y'] > screen_height + 50:
-                self.bullets.remove(b)
\ No newline at end of file
+        self.bullets.update(-50, screen_height + 50)
\ No newline at end of file
@@ -0,0 +1,69 @@
+class SpatialGrid:
+    """Índice espacial de grilla uniforme sobre el área de juego.
+
+    Cada entidad se inserta con un índice entero y su `pygame.Rect`; las
+    consultas devuelven los índices de las celdas que toca el rect, en orden
+    ascendente, para que el recorrido sea el mismo que el de la lista original.
+    Las coordenadas fuera del área se recortan a las celdas del borde.
+    """
+    def __init__(self, width, height, cell_size=64):
+        self.cell_size = cell_size
+        self.cols = max(1, -(-int(width) // cell_size))
+        self.rows = max(1, -(-int(height) // cell_size))
+        self.cells = [[] for _ in range(self.cols * self.rows)]
+        self.rects = []
+        self._used = []
+
+    def _span(self, rect):
+        cs = self.cell_size
+        cx0 = min(max(rect.x // cs, 0), self.cols - 1)
+        cx1 = min(max((rect.x + rect.w - 1) // cs, 0), self.cols - 1)
+        cy0 = min(max(rect.y // cs, 0), self.rows - 1)
+        cy1 = min(max((rect.y + rect.h - 1) // cs, 0), self.rows - 1)
+        return cx0, cx1, cy0, cy1
+
+    def clear(self):
+        cells = self.cells
+        for c in self._used:
+            cells[c].clear()
+        self._used.clear()
+        self.rects.clear()
+
+    def insert(self, rect):
+        """Agregar un rect; devuelve su índice (orden de inserción)"""
+        idx = len(self.rects)
+        self.rects.append(rect)
+        if rect.w <= 0 or rect.h <= 0:
+            return idx
+        cx0, cx1, cy0, cy1 = self._span(rect)
+        cells = self.cells
+        cols = self.cols
+        for cy in range(cy0, cy1 + 1):
+            base = cy * cols
+            for cx in range(cx0, cx1 + 1):
+                cell = cells[base + cx]
+                if not cell:
+                    self._used.append(base + cx)
+                cell.append(idx)
+        return idx
+
+    def rebuild(self, rects):
+        self.clear()
+        for r in rects:
+            self.insert(r)
+
+    def query(self, rect):
+        """Índices candidatos (ordenados) cuyas celdas se solapan con `rect`"""
+        if rect.w <= 0 or rect.h <= 0:
+            return []
+        cx0, cx1, cy0, cy1 = self._span(rect)
+        cells = self.cells
+        cols = self.cols
+        if cx0 == cx1 and cy0 == cy1:
+            return cells[cy0 * cols + cx0]
+        found = set()
+        for cy in range(cy0, cy1 + 1):
+            base = cy * cols
+            for cx in range(cx0, cx1 + 1):
+                found.update(cells[base + cx])
+        return sorted(found)
@@ -0,0 +1,307 @@
+import os
+import random
+
+import numpy as np
+import pygame
+
+from asset_cache import assets
+from firing import fire_batch, emit_shots
+from constants import ENEMY_TYPES, ENEMY_IMAGE_PATHS, ENEMY_SHOT_IMAGE_PATHS, ENEMY_WIDTH, ENEMY_HEIGHT
+
+
+# Filas de la matriz de enemigos (una columna por enemigo)
+X, Y, PREV_X, PREV_Y, DX, SPEED, HEALTH, COOLDOWN, COOLDOWN_MAX, SHOT_RATE = range(10)
+ROWS = 10
+
+# Variación horizontal según color (igual que EnemyWave)
+DX_FACTOR = {'blue': 0.6, 'green': 1.1, 'purple': 1.6}
+FLIP_CHANCE = 0.01
+
+
+def _column(row):
+    """Propiedad que lee/escribe la fila `row` de la columna del enemigo"""
+    def fget(self):
+        return float(self.owner._data[row, self.index])
+
+    def fset(self, value):
+        self.owner._data[row, self.index] = value
+    return property(fget, fset)
+
+
+class SwarmEnemy:
+    """Vista de un enemigo de `SwarmWave`: la columna `index` de su matriz.
+
+    Expone lo que `Game` usa de `Enemy` (posición, vida, rect, disparo);
+    los valores viven en los arreglos de la oleada.
+    """
+    __slots__ = ('owner', 'wave', 'index', 'color', 'width', 'height', 'image', 'mask',
+                 'bullet_img', 'base_score', 'shot_rate', 'max_health')
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.wave = None
+        self.index = 0
+        self.width = ENEMY_WIDTH
+        self.height = ENEMY_HEIGHT
+
+    x = _column(X)
+    y = _column(Y)
+    prev_x = _column(PREV_X)
+    prev_y = _column(PREV_Y)
+    dx = _column(DX)
+    speed = _column(SPEED)
+    health = _column(HEALTH)
+    shoot_cooldown = _column(COOLDOWN)
+    shoot_cooldown_max = _column(COOLDOWN_MAX)
+
+    def save_position(self):
+        col = self.owner._data[:, self.index]
+        col[PREV_X] = col[X]
+        col[PREV_Y] = col[Y]
+
+    def get_rect(self):
+        col = self.owner._data[:, self.index]
+        return pygame.Rect(int(col[X]), int(col[Y]), self.width, self.height)
+
+    def take_damage(self, damage):
+        self.health = max(0, self.health - damage)
+        return self.health <= 0
+
+    def is_alive(self):
+        return self.health > 0
+
+    def draw(self, window, alpha=1.0):
+        if not self.image:
+            return None
+        col = self.owner._data[:, self.index]
+        x = col[PREV_X] + (col[X] - col[PREV_X]) * alpha
+        y = col[PREV_Y] + (col[Y] - col[PREV_Y]) * alpha
+        return window.blit(self.image, (float(x), float(y)))
+
+    def shoot(self, level=1, bullets=None):
+        # Mismo criterio que Enemy.shoot, sobre la columna de la matriz
+        col = self.owner._data[:, self.index]
+        col[COOLDOWN] -= 1
+        if col[COOLDOWN] <= 0:
+            bw = max(4, int(self.width * 0.12))
+            bh = max(8, int(self.height * 0.4))
+            bx = float(col[X]) + (self.width - bw) / 2
+            by = float(col[Y]) + self.height
+            dy = 6 + (level * 0.02)
+            col[COOLDOWN] = max(15, int(col[COOLDOWN_MAX] * max(0.7, 1.0 - level * 0.005)))
+            if bullets is not None:
+                bullets.spawn(bx, by, bw, bh, dy, self.bullet_img)
+            return True
+        return False
+
+
+class SwarmWave:
+    """Oleada en modo enjambre: enemigos en una matriz NumPy.
+
+    Misma interfaz que `EnemyWave`. Movimiento, rebote en bordes, cambios de
+    dirección aleatorios y descarte de los que salen por abajo se resuelven
+    con operaciones sobre arreglos; `enemies` guarda vistas `SwarmEnemy`
+    alineadas con las columnas. La aparición usa el RNG de la sesión; los
+    cambios de dirección, un generador NumPy sembrado desde él.
+    """
+    def __init__(self, screen_width, screen_height, rng=None, pool=None):
+        self.rng = rng if rng is not None else random.Random()
+        # `pool` se acepta por compatibilidad con EnemyWave; las vistas se reciclan aquí
+        self._free = []
+        self._np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self._data = np.zeros((ROWS, 64), dtype=np.float64)
+        self.enemies = []
+        self.alive_count = 0
+        self._pending = 0
+        self._sprites = {}
+        # almacenar cantidad de la última oleada generada
+        self.prev_amount = None
+
+    def _sprites_for(self, color):
+        """(imagen, máscara, imagen de disparo) del color, cargadas una sola vez"""
+        sprites = self._sprites.get(color)
+        if sprites is None:
+            image = mask = shot = None
+            try:
+                path = ENEMY_IMAGE_PATHS.get(color)
+                if path and os.path.exists(path):
+                    image = assets.load_image(path, (ENEMY_WIDTH, ENEMY_HEIGHT))
+                    mask = assets.load_mask(path, (ENEMY_WIDTH, ENEMY_HEIGHT))
+            except Exception:
+                image = mask = None
+            try:
+                path = ENEMY_SHOT_IMAGE_PATHS.get(color)
+                if path and os.path.exists(path):
+                    shot = assets.load_image(path)
+            except Exception:
+                shot = None
+            sprites = self._sprites[color] = (image, mask, shot)
+        return sprites
+
+    def _view(self, index, color):
+        e = self._free.pop() if self._free else SwarmEnemy(self)
+        props = ENEMY_TYPES[color]
+        e.wave = self
+        e.index = index
+        e.color = color
+        e.base_score = props.get('score', 10)
+        e.shot_rate = props.get('shot_rate', 0.01)
+        e.max_health = props['health']
+        e.image, e.mask, e.bullet_img = self._sprites_for(color)
+        return e
+
+    def clear(self):
+        """Vaciar la oleada, conservando las vistas para reutilizarlas"""
+        for e in self.enemies:
+            e.wave = None
+            self._free.append(e)
+        self.enemies.clear()
+        self.alive_count = 0
+        self._pending = 0
+
+    def create_wave(self, level):
+        # Determinar cantidad: nivel 1 fija en 10; niveles siguientes = prev + (1..5)
+        if self.prev_amount is None:
+            amount = 10
+        else:
+            amount = self.prev_amount + self.rng.randint(1, 5)
+
+        self.clear()
+        if amount > self._data.shape[1]:
+            self._data = np.zeros((ROWS, max(amount, self._data.shape[1] * 2)), dtype=np.float64)
+        d = self._data
+        rng = self.rng
+        colors = list(ENEMY_TYPES.keys())
+        if level <= 1:
+            max_offset = 150
+        else:
+            max_offset = min(2000, 300 + level * 120)
+        speed_scale = 1.0 + (level - 1) * 0.03
+        for i in range(amount):
+            # mismo orden de consumo del RNG que EnemyWave + Enemy.reset
+            color = rng.choice(colors)
+            x = rng.randint(10, max(10, self.screen_width - ENEMY_WIDTH - 10))
+            y = rng.randint(-max_offset, -50)
+            props = ENEMY_TYPES[color]
+            dx = rng.choice([-1, 1]) * (0.5 + rng.random() * 1.5)
+            try:
+                base_cd = int(1.0 / float(props.get('shot_rate', 0.01)))
+            except Exception:
+                base_cd = 200
+            cd_max = max(12, base_cd - int(level * 4))
+            col = d[:, i]
+            col[X] = col[PREV_X] = x
+            col[Y] = col[PREV_Y] = y
+            col[DX] = dx * DX_FACTOR.get(color, 1.0)
+            col[SPEED] = props['speed'] * speed_scale
+            col[HEALTH] = props['health']
+            col[COOLDOWN_MAX] = cd_max
+            col[SHOT_RATE] = props.get('shot_rate', 0.01)
+            col[COOLDOWN] = rng.randint(0, cd_max)
+            self.enemies.append(self._view(i, color))
+
+        self.alive_count = amount
+        self.prev_amount = amount
+        return self.enemies
+
+    def update(self, level):
+        self.compact()
+        n = len(self.enemies)
+        if not n:
+            return
+        d = self._data[:, :n]
+        d[PREV_X] = d[X]
+        d[PREV_Y] = d[Y]
+        d[Y] += d[SPEED]
+        xs = d[X]
+        xs += d[DX]
+        # rebotar en bordes
+        left = xs < 0
+        right = xs + ENEMY_WIDTH > self.screen_width
+        xs[left] = 0
+        xs[right] = self.screen_width - ENEMY_WIDTH
+        # el rebote y el cambio aleatorio se cancelan si coinciden
+        flip = (left | right) ^ (self._np_rng.random(n) < FLIP_CHANCE)
+        d[DX, flip] *= -1
+        # Si salen de la pantalla por abajo, eliminarlos de la oleada
+        out = np.flatnonzero(d[Y] > self.screen_height + 50)
+        if out.size:
+            enemies = self.enemies
+            for i in out.tolist():
+                self.remove_enemy(enemies[i])
+            self.compact()
+
+    def compact(self):
+        """Quitar las bajas marcadas: compacta columnas y vistas conservando el orden"""
+        if not self._pending:
+            return
+        n = len(self.enemies)
+        keep = np.zeros(n, dtype=bool)
+        views = []
+        for i, e in enumerate(self.enemies):
+            if e.wave is self:
+                keep[i] = True
+                e.index = len(views)
+                views.append(e)
+            else:
+                self._free.append(e)
+        k = len(views)
+        self._data[:, :k] = self._data[:, :n][:, keep]
+        self.enemies[:] = views
+        self._pending = 0
+
+    def fire(self, level, bullets, max_bullets, rand, legacy_rate=True):
+        """Disparo en bloque (ver firing.fire_batch); devuelve cuántos dispararon"""
+        n = len(self.enemies)
+        d = self._data[:, :n]
+        fired = fire_batch(d[COOLDOWN], d[COOLDOWN_MAX], d[SHOT_RATE], level, rand,
+                           max_bullets - len(bullets), legacy_rate)
+        if fired.size:
+            enemies = self.enemies
+            emit_shots(bullets, d[X, fired], d[Y, fired],
+                       [enemies[i].bullet_img for i in fired.tolist()], level)
+        return int(fired.size)
+
+    def rects(self):
+        n = len(self.enemies)
+        xs = self._data[X, :n].astype(np.int64).tolist()
+        ys = self._data[Y, :n].astype(np.int64).tolist()
+        return [pygame.Rect(x, y, ENEMY_WIDTH, ENEMY_HEIGHT) for x, y in zip(xs, ys)]
+
+    def draw(self, window, alpha=1.0):
+        """Dibujar toda la oleada con un solo `blits`; devuelve los rects"""
+        n = len(self.enemies)
+        if not n:
+            return []
+        d = self._data[:, :n]
+        if alpha >= 1.0:
+            xs, ys = d[X], d[Y]
+        else:
+            xs = d[PREV_X] + (d[X] - d[PREV_X]) * alpha
+            ys = d[PREV_Y] + (d[Y] - d[PREV_Y]) * alpha
+        seq = [(e.image, (x, y)) for e, x, y in zip(self.enemies, xs.tolist(), ys.tolist())
+               if e.image and e.wave is self]
+        return window.blits(seq) if seq else []
+
+    def get_last_wave_count(self):
+        return self.prev_amount
+
+    def __len__(self):
+        return self.alive_count
+
+    def __iter__(self):
+        for e in self.enemies:
+            if e.wave is self:
+                yield e
+
+    def get_alive_enemies(self):
+        return self.enemies
+
+    def remove_enemy(self, enemy):
+        if enemy.wave is not self:
+            return
+        enemy.wave = None
+        self.alive_count -= 1
+        self._pending += 1
@@ -0,0 +1,58 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+import pytest
+
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from game import Game
+from inputs import AutopilotInput
+from replay import Replay, simulate
+
+
+def record_windowed(seed, pixel_perfect, max_ticks):
+    """Jugar con ventana (driver dummy) y grabar el replay"""
+    pygame.init()
+    window = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    game = Game(font=None, FPS=FPS, lives=3, window=window,
+                screen_width=SCREEN_WIDTH, screen_height=SCREEN_HEIGHT,
+                input_source=AutopilotInput(), seed=seed, record_replay=True,
+                scores=False, pixel_perfect=pixel_perfect)
+    game.in_menu = False
+    ticks = 0
+    while not game.game_over and ticks < max_ticks:
+        game.update()
+        ticks += 1
+    return game
+
+
+@pytest.mark.parametrize('pixel_perfect', [False, True])
+def test_windowed_replay_resimulates_headless(pixel_perfect):
+    game = record_windowed(1234, pixel_perfect, max_ticks=FPS * 60)
+    if pixel_perfect:
+        # la partida tiene que haber pasado por la narrowphase para que el test diga algo
+        assert game.narrowphase.rejected > 0
+    replay = Replay.from_bytes(game.replay.to_bytes())
+    assert replay.settings['pixel_perfect'] is pixel_perfect
+    result = simulate(replay, SCREEN_WIDTH, SCREEN_HEIGHT, FPS)
+    pygame.quit()
+    assert (result['level'], result['score'], result['kills']) == (game.level, game.score, game.kills)
+
+
+def test_replay_round_trip_keeps_inputs_and_settings():
+    settings = {'swarm': True, 'pixel_perfect': True, 'firing_mode': 'batched', 'firing_legacy_rate': False}
+    replay = Replay(42, 3, b'\x01\x02\x04\x07', settings)
+    loaded = Replay.from_bytes(replay.to_bytes())
+    assert (loaded.seed, loaded.lives, bytes(loaded.inputs)) == (42, 3, b'\x01\x02\x04\x07')
+    assert loaded.settings == settings
+
+
+def test_replay_rejects_bad_data():
+    data = Replay(1, 3, b'\x00' * 10).to_bytes()
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b'XXXX' + data[4:])
+    with pytest.raises(ValueError):
+        Replay.from_bytes(data[:-1])
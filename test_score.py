@@ -0,0 +1,34 @@
+import time
+
+from score import Puntajes
+
+
+def wait_for(db, ticket, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for done, ok in db.poll_completed():
+            if done == ticket:
+                return ok
+        time.sleep(0.01)
+    raise AssertionError("el escritor no confirmó el puntaje")
+
+
+def test_read_interleaved_with_commit_is_not_cached(tmp_path):
+    db = Puntajes(str(tmp_path / 'scores.db'))
+    try:
+        db.add_score('ana', 1, 1.0, 1, 100)
+        real_query = db._query
+
+        def query_then_commit(query, params=()):
+            rows = real_query(query, params)
+            # el escritor confirma un puntaje mientras la lectura está en curso
+            db._query = real_query
+            assert wait_for(db, db.submit_score('beto', 9, 9.0, 9, 999))
+            return rows
+
+        db._query = query_then_commit
+        # la lectura en curso devuelve lo que leyó, pero no lo deja en la caché
+        assert db.get_best_score()[4] == 100
+        assert db.get_best_score()[4] == 999
+    finally:
+        db.close()
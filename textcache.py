@@ -0,0 +1,44 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """Caché LRU de textos renderizados y de fuentes por tamaño.
+
+    Las superficies se indexan por (fuente, texto, color, antialias); los
+    textos que no cambian entre frames (etiquetas, botones, "Level: N") se
+    renderizan una sola vez.
+    """
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self._fonts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size, name=None):
+        """Fuente `pygame.font.Font(name, size)` compartida"""
+        key = (name, size)
+        f = self._fonts.get(key)
+        if f is None:
+            f = pygame.font.Font(name, size)
+            self._fonts[key] = f
+        return f
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._surfaces.clear()